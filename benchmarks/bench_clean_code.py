@@ -0,0 +1,116 @@
+# Benchmark da função clean_code: versão original (.apply linha a linha) x versão vetorizada.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.bench_clean_code
+#     python -m benchmarks.bench_clean_code --scales 1 10 100 1000 --repeat 3
+
+# Importando as Bibliotecas:
+
+import argparse
+import time
+import warnings
+
+import pandas as pd
+
+from utils.data import DATASET_PATH, clean_code
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Versão original da Função de Limpeza, mantida como referência do benchmark:
+def clean_code_legacy(df):
+    df = df.drop("Switch to order menu", axis=1)
+
+    df = df.rename(
+        columns={
+            "Restaurant ID": "Restaurant_ID",
+            "Restaurant Name": "Restaurant_Name",
+            "Country Code": "Country_Name",
+            "Locality Verbose": "Locality_Verbose",
+            "Average Cost for two": "Average_Cost_for_two",
+            "Has Table booking": "Has_Table_booking",
+            "Has Online delivery": "Has_Online_delivery",
+            "Is delivering now": "Is_delivering_now",
+            "Price range": "Price_range",
+            "Aggregate rating": "Aggregate_rating",
+            "Rating color": "Rating_color",
+            "Rating text": "Rating_text",
+        }
+    )
+
+    df = df.drop_duplicates()
+    df = df.dropna()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", pd.errors.SettingWithCopyWarning)
+        df["Cuisines"] = df.loc[:, "Cuisines"].astype(str).apply(lambda x: x.split(",")[0])
+
+    df = df.loc[df["Cuisines"] != "Mineira", :]
+    df = df.loc[df["Cuisines"] != "Drinks Only", :]
+
+    return df
+
+
+def scale_dataset(df_raw, scale):
+    """Esta função replica o conjunto de dados 'scale' vezes.
+
+    Cada réplica recebe Restaurant IDs novos, assim as réplicas não são removidas como
+    duplicatas, enquanto as duplicatas do arquivo original continuam presentes em cada réplica.
+
+    Input: Dataframe Sujo e fator de escala.
+    Output: Dataframe Sujo com 'scale' vezes mais linhas.
+    """
+    if scale == 1:
+        return df_raw
+
+    offset = int(df_raw["Restaurant ID"].max()) + 1
+    replicas = []
+    for i in range(scale):
+        replica = df_raw.copy()
+        replica["Restaurant ID"] += i * offset
+        replicas.append(replica)
+
+    return pd.concat(replicas, ignore_index=True)
+
+
+def best_time(func, df, repeat):
+    tempos = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        result = func(df)
+        tempos.append(time.perf_counter() - inicio)
+
+    return min(tempos), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da função clean_code")
+    parser.add_argument("--path", default=DATASET_PATH)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df_raw = pd.read_csv(args.path)
+
+    print(f"{'escala':>8} {'linhas':>12} {'original (s)':>14} {'vetorizada (s)':>16} {'speedup':>9}")
+    for scale in args.scales:
+        df = scale_dataset(df_raw, scale)
+
+        tempo_legacy, esperado = best_time(clean_code_legacy, df, args.repeat)
+        tempo_novo, obtido = best_time(clean_code, df, args.repeat)
+
+        # A versão vetorizada deve produzir exatamente o mesmo dataframe (a coluna All_Cuisines
+        # não existia na versão original):
+        pd.testing.assert_frame_equal(obtido.drop(columns="All_Cuisines"), esperado)
+
+        print(
+            f"{scale:>7}x {len(df):>12,} {tempo_legacy:>14.4f} {tempo_novo:>16.4f}"
+            f" {tempo_legacy / tempo_novo:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
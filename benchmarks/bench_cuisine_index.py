@@ -0,0 +1,219 @@
+# Verificação e benchmark do índice de culinárias: explode do pandas x índice CSR.
+#
+# Para cada escala, compara o índice CSR (build_cuisine_index), o cubo de culinárias por país
+# (build_cuisine_cube) e o melhor e o pior restaurante de cada culinária (build_best_per_cuisine)
+# com uma referência que cria uma linha por par (restaurante, culinária) com str.split e explode
+# e agrega com groupby e sort_values. Qualquer diferença interrompe o script.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.bench_cuisine_index
+#     python -m benchmarks.bench_cuisine_index --scales 1 10 100 --repeat 3
+
+# Importando as Bibliotecas:
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_pages import dataset_for_scale
+from utils.cube import MIN_VOTES
+from utils.cuisine_index import (
+    CUISINE_SEPARATOR,
+    build_cuisine_cube,
+    build_cuisine_index,
+    pair_rows,
+)
+from utils.cuisines import METRIC_COLUMNS, build_best_per_cuisine
+from utils.data import DATASET_PATH, NEGATIVE_CUISINES, prepare_data, read_source
+
+# Textos de All_Cuisines que não aparecem no zomato.csv, mas que o índice deve tratar: nomes
+# repetidos, espaços extras, nomes vazios e culinárias de NEGATIVE_CUISINES.
+EDGE_CASE_CUISINES = [
+    "Italian, Pizza, Italian",
+    " Cafe ,, Bakery , ",
+    "Mineira, Brazilian",
+    "Drinks Only",
+    "Drinks Only, Mineira",
+    "Japanese,Sushi,Japanese ,Sushi",
+    ",",
+]
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Versões com explode, mantidas como referência do benchmark:
+def cuisine_pairs_reference(df):
+    """Esta função cria uma linha por par (restaurante, culinária) com str.split e explode.
+
+    Input: Dataframe Limpo e Enriquecido
+    Output: Dataframe com as colunas linha (posição no dataframe) e Cuisines, na ordem das
+            linhas e, dentro de cada linha, na ordem do texto de All_Cuisines.
+    """
+    nomes = df["All_Cuisines"].astype(str).str.split(CUISINE_SEPARATOR).reset_index(drop=True)
+    nomes = nomes.explode().str.strip()
+
+    pares = pd.DataFrame({"linha": nomes.index.to_numpy(), "Cuisines": nomes.to_numpy()})
+    pares = pares.loc[(pares["Cuisines"] != "") & ~pares["Cuisines"].isin(NEGATIVE_CUISINES), :]
+
+    return pares.drop_duplicates().reset_index(drop=True)
+
+
+def cuisine_cube_reference(df, pares):
+    """Esta função cria o cubo de culinárias por país com groupby sobre os pares.
+
+    Input: Dataframe Limpo e Enriquecido e pares (cuisine_pairs_reference).
+    Output: Tabela com as colunas Country_Name, Cuisines e os agregados, como texto.
+    """
+    linhas = df.iloc[pares["linha"]]
+    min_votes = linhas["Votes"].to_numpy() >= MIN_VOTES
+
+    tabela = pd.DataFrame(
+        {
+            "Country_Name": linhas["Country_Name"].astype(str).to_numpy(),
+            "Cuisines": pares["Cuisines"].to_numpy(),
+            "Restaurants": 1,
+            "Restaurants_min_votes": min_votes.astype(np.int64),
+            "Rating_sum_min_votes": np.where(min_votes, linhas["Aggregate_rating"], 0.0),
+        }
+    )
+
+    return tabela.groupby(["Country_Name", "Cuisines"], as_index=False).sum()
+
+
+def best_per_cuisine_reference(df, pares):
+    """Esta função encontra o melhor e o pior restaurante de cada culinária com sort_values.
+
+    Input: Dataframe Limpo e Enriquecido e pares (cuisine_pairs_reference).
+    Output: Dicionário {"best": {culinária: restaurante}, "worst": {culinária: restaurante}}.
+    """
+    linhas = df.iloc[pares["linha"]]
+    ordenados = pares.assign(
+        Aggregate_rating=linhas["Aggregate_rating"].to_numpy(),
+        Restaurant_ID=linhas["Restaurant_ID"].to_numpy(),
+    ).sort_values(["Cuisines", "Aggregate_rating", "Restaurant_ID"], ascending=[True, False, True])
+
+    escolhidos = {
+        "best": ordenados.drop_duplicates("Cuisines", keep="first"),
+        "worst": ordenados.loc[ordenados["Aggregate_rating"] > 0, :].drop_duplicates(
+            "Cuisines", keep="last"
+        ),
+    }
+
+    restaurants = {}
+    for kind, escolha in escolhidos.items():
+        rows = df.iloc[escolha["linha"]].loc[:, METRIC_COLUMNS]
+        restaurants[kind] = dict(zip(escolha["Cuisines"], rows.to_dict("records")))
+
+    return restaurants
+
+
+def edge_cases(df):
+    """Esta função cria um dataframe com as primeiras linhas e os textos de EDGE_CASE_CUISINES.
+
+    Input: Dataframe Limpo e Enriquecido
+    Output: Dataframe com uma linha por texto de EDGE_CASE_CUISINES, repetido algumas vezes.
+    """
+    textos = EDGE_CASE_CUISINES * 3
+    df_edge = df.head(len(textos)).copy()
+    df_edge["All_Cuisines"] = pd.Categorical(
+        textos[: len(df_edge)], categories=sorted(set(textos)), ordered=True
+    )
+
+    return df_edge
+
+
+def reference(df):
+    pares = cuisine_pairs_reference(df)
+    return pares, cuisine_cube_reference(df, pares), best_per_cuisine_reference(df, pares)
+
+
+def csr(df):
+    index = build_cuisine_index(df)
+    return index, build_cuisine_cube(df, index), build_best_per_cuisine(df, index)
+
+
+def best_time(func, df, repeat):
+    tempos = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        result = func(df)
+        tempos.append(time.perf_counter() - inicio)
+
+    return min(tempos), result
+
+
+def assert_same_results(obtido, esperado):
+    """Esta função compara os resultados do índice CSR com os da referência com explode.
+
+    Input: Resultados de csr(df) e de reference(df).
+    Output: Nenhum (AssertionError na primeira diferença).
+    """
+    index, cuisine_cube, best = obtido
+    pares, cuisine_cube_esperado, best_esperado = esperado
+
+    # Os mesmos pares (linha, culinária), na mesma ordem, e o vocabulário em ordem alfabética:
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(
+            {
+                "linha": pair_rows(index),
+                "Cuisines": index["cuisines"][index["codes"]].to_numpy(),
+            }
+        ),
+        pares,
+    )
+    pd.testing.assert_index_equal(
+        index["cuisines"], pd.Index(sorted(pares["Cuisines"].unique()))
+    )
+
+    # O cubo com as categorias como texto (as somas das notas podem diferir no último bit):
+    pd.testing.assert_frame_equal(
+        cuisine_cube.astype({"Country_Name": str, "Cuisines": str}),
+        cuisine_cube_esperado,
+    )
+
+    for kind in ("best", "worst"):
+        pd.testing.assert_frame_equal(
+            pd.DataFrame.from_dict(best[kind], orient="index").sort_index(),
+            pd.DataFrame.from_dict(best_esperado[kind], orient="index").sort_index(),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verificação e benchmark do índice de culinárias")
+    parser.add_argument("--path", default=DATASET_PATH)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    n_seed_rows = len(pd.read_csv(args.path))
+
+    df_edge = prepare_data(read_source(args.path))
+    assert_same_results(csr(edge_cases(df_edge)), reference(edge_cases(df_edge)))
+
+    print(
+        f"{'escala':>8} {'linhas':>12} {'pares':>12} {'explode (s)':>13} {'CSR (s)':>9}"
+        f" {'speedup':>9}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in args.scales:
+            df = prepare_data(read_source(dataset_for_scale(args.path, n_seed_rows, scale, workdir)))
+
+            tempo_referencia, esperado = best_time(reference, df, args.repeat)
+            tempo_novo, obtido = best_time(csr, df, args.repeat)
+
+            assert_same_results(obtido, esperado)
+
+            print(
+                f"{scale:>7}x {len(df):>12,} {len(esperado[0]):>12,} {tempo_referencia:>13.4f}"
+                f" {tempo_novo:>9.4f} {tempo_referencia / tempo_novo:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Relatório de memória do dataframe limpo: colunas de texto x colunas categóricas.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.bench_memory
+
+# Importando as Bibliotecas:
+
+import argparse
+
+import pandas as pd
+
+from utils.data import DATASET_PATH, clean_code, enrich_data, to_categoricals
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def memory_report(df_antes, df_depois):
+    """Esta função compara o uso de memória (memory_usage(deep=True)) de dois dataframes por coluna.
+
+    Input: Dataframe antes e depois da conversão.
+    Output: Tabela com a memória em KB de cada coluna antes e depois, e a redução percentual.
+    """
+    report = pd.DataFrame(
+        {
+            "antes_kb": df_antes.memory_usage(index=False, deep=True) / 1024,
+            "depois_kb": df_depois.memory_usage(index=False, deep=True) / 1024,
+        }
+    )
+    report.loc["TOTAL"] = report.sum()
+    report["reducao_%"] = 100 * (1 - report["depois_kb"] / report["antes_kb"])
+
+    return report.round(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relatório de memória do dataframe limpo")
+    parser.add_argument("--path", default=DATASET_PATH)
+    args = parser.parse_args()
+
+    df_texto = enrich_data(clean_code(pd.read_csv(args.path)))
+    df_categorias = to_categoricals(df_texto.copy())
+
+    print(memory_report(df_texto, df_categorias).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+# Benchmark das funções das páginas: carga dos dados, gráficos, tabelas, métricas e mapa.
+#
+# Mede cada função sobre o zomato.csv original e sobre conjuntos sintéticos (benchmarks.synthetic)
+# 10x, 100x e 1000x maiores, reportando o tempo de execução, o pico de memória e a memória retida
+# pela chamada (alocada por ela e ainda em uso ao final).
+# Os resultados são salvos em JSON para comparação entre commits.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.bench_pages
+#     python -m benchmarks.bench_pages --scales 1 10 --repeat 5 --label antes
+#     python -m benchmarks.bench_pages --scales 1 10 --label depois --compare benchmarks/results/antes.json
+
+# Importando as Bibliotecas:
+
+import argparse
+import inspect
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx
+from streamlit.runtime.state import SafeSessionState, SessionState
+
+from benchmarks.synthetic import generate_dataset
+from utils.cities import (
+    best_seven_restaurants,
+    top_ten_cities_restaurants,
+    top_ten_cities_unique_cuisines,
+    worst_seven_restaurants,
+)
+from utils.countries import (
+    avg_ratings_by_countries,
+    cities_by_countries,
+    plate_for_two_by_countries,
+    restaurants_by_countries,
+)
+from utils.cube import MIN_VOTES, RATING_BINS, RATING_BUCKETS, load_cube, load_rating_buckets
+from utils.cuisine_index import load_cuisine_cube, load_cuisine_index
+from utils.cuisines import (
+    best_per_cuisine,
+    build_best_per_cuisine,
+    top_best_restaurants,
+    top_types_cuisines,
+)
+from utils.data import CHUNK_SIZE_ENV_VAR, DATASET_PATH, clean_code, load_data, read_source
+from utils.filter_index import load_filter_index
+from utils.ranking import load_ranking_index
+from utils.restaurant_map import render_map
+from utils.snapshot import snapshot_path
+from utils.spatial import load_spatial_hierarchy
+from utils.sql_backend import duckdb, query_cube, query_cuisine_cube, query_rating_buckets
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+# Seleções padrão dos filtros das páginas:
+DEFAULT_COUNTRIES = [
+    "Australia",
+    "Brazil",
+    "Canada",
+    "England",
+    "India",
+    "Qatar",
+    "South Africa",
+    "United States of America",
+]
+DEFAULT_TOP_N = 10
+DEFAULT_CUISINES = ["Home-made", "BBQ", "Japanese", "Brazilian", "Arabian", "American", "Italian"]
+DEFAULT_METRIC_CUISINES = ["Italian", "American", "Arabian", "Japanese", "Brazilian"]
+
+# Linhas por bloco na medição da leitura do CSV em streaming:
+STREAM_CHUNK_SIZE = 100_000
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def attach_script_run_ctx():
+    """Esta função associa um contexto de execução do Streamlit à thread atual.
+
+    Fora do 'streamlit run' não existe ScriptRunContext e os caches do Streamlit tratam toda
+    leitura como ausência no cache, recalculando tudo a cada chamada. Com o contexto, as funções
+    são medidas com os mesmos caches do app.
+
+    Input: Nenhum.
+    Output: Nenhum.
+    """
+    ctx = ScriptRunContext(
+        session_id="benchmark",
+        _enqueue=lambda msg: None,
+        query_string="",
+        session_state=SafeSessionState(SessionState()),
+        uploaded_file_mgr=None,
+        page_script_hash="",
+        user_info={"email": None},
+    )
+    add_script_run_ctx(ctx=ctx)
+
+
+def clear_caches(path=None):
+    """Esta função limpa os caches do Streamlit e, opcionalmente, o snapshot Parquet do arquivo.
+
+    Input: Caminho do conjunto de dados cujo snapshot deve ser removido (ou None).
+    Output: Nenhum.
+    """
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+    if path is not None and os.path.exists(snapshot_path(path)):
+        os.remove(snapshot_path(path))
+
+
+def load_data_in_chunks(path, chunk_size=STREAM_CHUNK_SIZE):
+    """Esta função carrega o conjunto de dados com a leitura do CSV em blocos (streaming).
+
+    Input: Caminho do conjunto de dados e quantidade de linhas por bloco.
+    Output: Dataframe Limpo e Enriquecido.
+    """
+    os.environ[CHUNK_SIZE_ENV_VAR] = str(chunk_size)
+    try:
+        return load_data(path)
+    finally:
+        del os.environ[CHUNK_SIZE_ENV_VAR]
+
+
+def measure(func, repeat, setup=None):
+    """Esta função mede o tempo de execução e a memória de uma função.
+
+    O tempo é o melhor de 'repeat' execuções (perf_counter). A memória é medida numa execução
+    separada com tracemalloc, para não distorcer o tempo: o pico de memória durante a chamada e
+    a memória alocada pela chamada que continua retida depois dela (caches, resultado).
+    A função 'setup', quando informada, roda antes de cada execução e fora da medição.
+
+    Input: Função sem argumentos, quantidade de repetições e função de preparação.
+    Output: Dicionário com tempo_s, pico_mb e retido_mb.
+    """
+    tempos = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        antes, _ = tracemalloc.get_traced_memory()
+        func()
+        depois, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "tempo_s": min(tempos),
+        "pico_mb": (pico - antes) / 2**20,
+        "retido_mb": (depois - antes) / 2**20,
+    }
+
+
+def page_cases(path, countries):
+    """Esta função lista as funções das páginas que são medidas com os dados já carregados.
+
+    As funções são medidas sem os decoradores (inspect.unwrap), ou seja, sem o cache de figuras:
+    o tempo medido é o de uma seleção que ainda não está em cache. O custo de um acerto no cache
+    de figuras aparece à parte, em figure_cache.restaurants_by_countries.
+
+    Input: Caminho do conjunto de dados e países selecionados.
+    Output: Lista de trios (nome, função, argumentos).
+    """
+    return [
+        ("countries.restaurants_by_countries", restaurants_by_countries, (countries, path)),
+        ("countries.cities_by_countries", cities_by_countries, (countries, path)),
+        ("countries.avg_ratings_by_countries", avg_ratings_by_countries, (countries, path)),
+        ("countries.plate_for_two_by_countries", plate_for_two_by_countries, (countries, path)),
+        ("cities.top_ten_cities_restaurants", top_ten_cities_restaurants, (countries, path)),
+        ("cities.best_seven_restaurants", best_seven_restaurants, (countries, path)),
+        ("cities.worst_seven_restaurants", worst_seven_restaurants, (countries, path)),
+        ("cities.top_ten_cities_unique_cuisines", top_ten_cities_unique_cuisines, (countries, path)),
+        ("cuisines.best_per_cuisine", best_per_cuisine, (DEFAULT_METRIC_CUISINES, "best", path)),
+        (
+            "cuisines.top_best_restaurants",
+            top_best_restaurants,
+            (countries, DEFAULT_TOP_N, DEFAULT_CUISINES, path),
+        ),
+        ("cuisines.top_types_cuisines", top_types_cuisines, (countries, DEFAULT_TOP_N, False, path)),
+        ("restaurant_map.render_map", render_map, (tuple(sorted(countries)), path)),
+    ]
+
+
+def dataset_for_scale(seed_path, n_seed_rows, scale, workdir):
+    """Esta função cria o conjunto de dados de um fator de escala no diretório temporário.
+
+    Input: Arquivo original e sua quantidade de linhas, fator de escala e diretório temporário.
+    Output: Caminho do conjunto de dados (cópia do original em 1x, sintético nas demais escalas).
+    """
+    path = os.path.join(workdir, f"zomato_{scale}x.csv")
+    if scale == 1:
+        # Cópia com a mesma extensão do original, que pode estar comprimido (ex.: .csv.zip):
+        path += os.path.basename(seed_path).partition(".csv")[2]
+        shutil.copyfile(seed_path, path)
+    else:
+        generate_dataset(path, scale * n_seed_rows, seed_path)
+
+    return path
+
+
+def bench_scale(seed_path, n_seed_rows, scale, workdir, repeat, all_countries):
+    """Esta função mede todas as funções para um fator de escala.
+
+    As etapas de carga são medidas a frio (caches limpos, com e sem snapshot Parquet). As funções
+    das páginas são medidas com os dados, o cubo, o índice de filtros e a hierarquia espacial já
+    carregados, como acontece a cada interação do usuário no app.
+
+    Input: Arquivo original e sua quantidade de linhas, fator de escala, diretório temporário,
+           repetições e se todos os países devem ser selecionados.
+    Output: Dicionário com a quantidade de linhas e as medições de cada função.
+    """
+    path = dataset_for_scale(seed_path, n_seed_rows, scale, workdir)
+    df = read_source(path)
+
+    resultados = {}
+    resultados["data.clean_code"] = measure(lambda: clean_code(df), repeat)
+    resultados["data.load_data (csv)"] = measure(
+        lambda: load_data(path), repeat, setup=lambda: clear_caches(path)
+    )
+    resultados["data.load_data (csv em blocos)"] = measure(
+        lambda: load_data_in_chunks(path), repeat, setup=lambda: clear_caches(path)
+    )
+    resultados["data.load_data (snapshot)"] = measure(
+        lambda: load_data(path), repeat, setup=clear_caches
+    )
+    resultados["cube.load_cube"] = measure(
+        lambda: load_cube(path), repeat, setup=lambda: (st.cache_resource.clear(), load_data(path))
+    )
+    resultados["cube.load_rating_buckets"] = measure(
+        lambda: load_rating_buckets(path),
+        repeat,
+        setup=lambda: (st.cache_resource.clear(), load_data(path)),
+    )
+    resultados["filter_index.load_filter_index"] = measure(
+        lambda: load_filter_index(path),
+        repeat,
+        setup=lambda: (st.cache_resource.clear(), load_data(path)),
+    )
+    resultados["ranking.load_ranking_index"] = measure(
+        lambda: load_ranking_index(path),
+        repeat,
+        setup=lambda: (st.cache_resource.clear(), load_data(path)),
+    )
+    resultados["cuisine_index.load_cuisine_index"] = measure(
+        lambda: load_cuisine_index(path),
+        repeat,
+        setup=lambda: (st.cache_resource.clear(), load_data(path)),
+    )
+    resultados["cuisine_index.load_cuisine_cube"] = measure(
+        lambda: load_cuisine_cube(path),
+        repeat,
+        setup=lambda: (st.cache_resource.clear(), load_data(path), load_cuisine_index(path)),
+    )
+    if duckdb is not None:
+        # Mesmas tabelas com SQL sobre o snapshot (FOME_ZERO_QUERY_BACKEND=duckdb):
+        load_data(path)
+        resultados["sql_backend.query_cube"] = measure(lambda: query_cube(path), repeat)
+        resultados["sql_backend.query_rating_buckets"] = measure(
+            lambda: query_rating_buckets(path, RATING_BINS, RATING_BUCKETS), repeat
+        )
+        resultados["sql_backend.query_cuisine_cube"] = measure(
+            lambda: query_cuisine_cube(path, MIN_VOTES), repeat
+        )
+    resultados["cuisines.build_best_per_cuisine"] = measure(
+        lambda: build_best_per_cuisine(load_data(path), load_cuisine_index(path)), repeat
+    )
+    resultados["spatial.load_spatial_hierarchy"] = measure(
+        lambda: load_spatial_hierarchy(path),
+        repeat,
+        setup=lambda: (st.cache_resource.clear(), load_data(path)),
+    )
+
+    # Dados e estruturas derivadas já carregados, como no app depois da primeira execução:
+    linhas = len(load_data(path))
+    load_cube(path)
+    load_rating_buckets(path)
+    load_filter_index(path)
+    load_cuisine_index(path)
+    load_cuisine_cube(path)
+    load_ranking_index(path)
+    load_spatial_hierarchy(path)
+    best_per_cuisine(DEFAULT_METRIC_CUISINES, path=path)
+
+    countries = DEFAULT_COUNTRIES
+    if all_countries:
+        countries = load_data(path)["Country_Name"].unique().tolist()
+
+    for nome, func, args in page_cases(path, countries):
+        raw = inspect.unwrap(func)
+        resultados[nome] = measure(lambda: raw(*args), repeat)
+
+    restaurants_by_countries(countries, path)
+    resultados["figure_cache.restaurants_by_countries"] = measure(
+        lambda: restaurants_by_countries(countries, path), repeat
+    )
+
+    clear_caches(path)
+    os.remove(path)
+
+    return {"linhas_brutas": len(df), "linhas": linhas, "funcoes": resultados}
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "sem-git"
+
+
+def print_results(results, baseline=None):
+    """Esta função exibe as medições de cada escala e, se houver, a razão em relação a outra execução.
+
+    Input: Resultados desta execução e resultados de referência (ou None).
+    Output: Nenhum.
+    """
+    for scale, medicoes in results["escalas"].items():
+        print(f"\n== {scale}x ({medicoes['linhas_brutas']:,} linhas, {medicoes['linhas']:,} após a limpeza)")
+        print(f"{'função':<42} {'tempo (s)':>10} {'pico (MB)':>10} {'retido (MB)':>13} {'x ref':>7}")
+
+        referencia = {}
+        if baseline is not None:
+            referencia = baseline["escalas"].get(scale, {}).get("funcoes", {})
+
+        for nome, m in medicoes["funcoes"].items():
+            razao = ""
+            if nome in referencia and m["tempo_s"] > 0:
+                razao = f"{referencia[nome]['tempo_s'] / m['tempo_s']:.2f}x"
+            print(
+                f"{nome:<42} {m['tempo_s']:>10.4f} {m['pico_mb']:>10.1f} {m['retido_mb']:>13.1f}"
+                f" {razao:>7}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das funções das páginas")
+    parser.add_argument("--path", default=DATASET_PATH)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--all-countries", action="store_true", help="seleciona todos os países")
+    parser.add_argument("--label", default=None, help="nome do JSON (padrão: commit atual)")
+    parser.add_argument("--compare", default=None, help="JSON de outra execução para comparação")
+    args = parser.parse_args()
+
+    # Fora do 'streamlit run' os caches funcionam, mas emitem avisos a cada chamada:
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore")
+    attach_script_run_ctx()
+
+    revisao = git_revision()
+    results = {
+        "revisao": revisao,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "repeat": args.repeat,
+        "todos_os_paises": args.all_countries,
+        "escalas": {},
+    }
+
+    n_seed_rows = len(pd.read_csv(args.path))
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in args.scales:
+            results["escalas"][str(scale)] = bench_scale(
+                args.path, n_seed_rows, scale, workdir, args.repeat, args.all_countries
+            )
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output = os.path.join(RESULTS_DIR, f"{args.label or revisao}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+    print(f"\nResultados salvos em {output}")
+
+
+if __name__ == "__main__":
+    main()
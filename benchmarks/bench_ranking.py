@@ -0,0 +1,140 @@
+# Verificação e benchmark da função top_ranked: ordenação completa da seleção x índice de ranking.
+#
+# Para cada escala, compara top_ranked (listas de ranking percorridas com heapq.merge) com uma
+# referência por força bruta sobre o dataframe: filtro da seleção, ordenação estável por nota e
+# votos, remoção dos nomes repetidos e top_n, em várias seleções aleatórias de países, culinárias
+# e top_n. Qualquer diferença nas posições retornadas interrompe o script.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.bench_ranking
+#     python -m benchmarks.bench_ranking --scales 1 10 100 --selections 300
+
+# Importando as Bibliotecas:
+
+import argparse
+import logging
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_pages import attach_script_run_ctx, dataset_for_scale
+from utils.cube import MIN_VOTES
+from utils.cuisine_index import split_cuisines
+from utils.data import DATASET_PATH, load_data
+from utils.ranking import load_ranking_index, top_ranked
+
+# Quantidades de restaurantes sorteadas para as seleções:
+TOP_N_OPTIONS = [1, 5, 10, 20, 50, 100]
+# Culinária que não existe nos dados, sorteada em parte das seleções:
+MISSING_CUISINE = "Culinária Inexistente"
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Versão por força bruta do ranking, mantida como referência do benchmark:
+def top_ranked_reference(df, pares, countries_options, cuisines_options, top_n):
+    """Esta função retorna as linhas dos top_n restaurantes melhor ranqueados, sem índice.
+
+    Input: Dataframe Limpo e Enriquecido, pares (posição da linha, culinária), países e
+           culinárias selecionados e quantidade de restaurantes.
+    Output: Array com as posições das linhas no dataframe, do melhor para o pior ranking.
+    """
+    com_culinaria = np.zeros(len(df), dtype=bool)
+    com_culinaria[pares.index[pares.isin(cuisines_options)]] = True
+
+    selecao = (
+        com_culinaria
+        & df["Country_Name"].isin(countries_options).to_numpy()
+        & (df["Votes"].to_numpy() >= MIN_VOTES)
+    )
+    ranking = (
+        df.loc[selecao, ["Restaurant_Name", "Aggregate_rating", "Votes"]]
+        .assign(posicao=np.flatnonzero(selecao))
+        .sort_values(["Aggregate_rating", "Votes"], ascending=False, kind="stable")
+        .drop_duplicates("Restaurant_Name")
+    )
+
+    return ranking["posicao"].to_numpy()[:top_n]
+
+
+def random_selections(df, pares, n_selections, random_state=42):
+    """Esta função sorteia seleções de países, culinárias e top_n para a comparação.
+
+    Input: Dataframe Limpo e Enriquecido, pares (posição da linha, culinária), quantidade de
+           seleções e semente.
+    Output: Lista de trios (países, culinárias, top_n).
+    """
+    rng = np.random.default_rng(random_state)
+    countries = df["Country_Name"].cat.categories.to_numpy()
+    cuisines = np.unique(pares.to_numpy(str))
+
+    selecoes = []
+    for _ in range(n_selections):
+        paises = list(rng.choice(countries, rng.integers(0, len(countries) + 1), replace=False))
+        culinarias = list(rng.choice(cuisines, rng.integers(0, 30), replace=False))
+        if rng.random() < 0.1:
+            culinarias.append(MISSING_CUISINE)
+        selecoes.append((paises, culinarias, int(rng.choice(TOP_N_OPTIONS))))
+
+    return selecoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verificação e benchmark da função top_ranked")
+    parser.add_argument("--path", default=DATASET_PATH)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--selections", type=int, default=300)
+    args = parser.parse_args()
+
+    # Fora do 'streamlit run' os caches funcionam, mas emitem avisos a cada chamada:
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore")
+    attach_script_run_ctx()
+
+    n_seed_rows = len(pd.read_csv(args.path))
+
+    print(
+        f"{'escala':>8} {'linhas':>12} {'seleções':>9} {'referência (s)':>15}"
+        f" {'top_ranked (s)':>15} {'speedup':>9}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in args.scales:
+            path = dataset_for_scale(args.path, n_seed_rows, scale, workdir)
+            df = load_data(path)
+            load_ranking_index(path)
+
+            pares = df["All_Cuisines"].astype(str).map(split_cuisines).reset_index(drop=True)
+            pares = pares.explode().dropna()
+            selecoes = random_selections(df, pares, args.selections)
+
+            tempo_referencia = tempo_novo = 0.0
+            for i, (paises, culinarias, top_n) in enumerate(selecoes):
+                inicio = time.perf_counter()
+                esperado = top_ranked_reference(df, pares, paises, culinarias, top_n)
+                tempo_referencia += time.perf_counter() - inicio
+
+                inicio = time.perf_counter()
+                obtido = top_ranked(paises, culinarias, top_n, path)
+                tempo_novo += time.perf_counter() - inicio
+
+                # O índice de ranking deve retornar exatamente as mesmas linhas, na mesma ordem:
+                np.testing.assert_array_equal(
+                    obtido,
+                    esperado,
+                    err_msg=f"seleção {i}: países={paises}, culinárias={culinarias}, top_n={top_n}",
+                )
+
+            print(
+                f"{scale:>7}x {len(df):>12,} {len(selecoes):>9} {tempo_referencia:>15.4f}"
+                f" {tempo_novo:>15.4f} {tempo_referencia / tempo_novo:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Verificação e benchmark da leitura do CSV em blocos: prepare_data(read_source) x stream_csv.
+#
+# Para cada escala e tamanho de bloco, compara o dataframe de stream_csv (blocos limpos um a um,
+# com as duplicatas entre blocos removidas pelos arrays ordenados de IDs) com o da leitura do CSV
+# inteiro. Além das escalas, um arquivo com cópias exatas e versões conflitantes de restaurantes
+# no final (em outro bloco que o da primeira ocorrência) exercita a remoção entre blocos.
+# Qualquer diferença interrompe o script.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.bench_stream
+#     python -m benchmarks.bench_stream --scales 1 10 100 --chunk-sizes 1000 100000
+
+# Importando as Bibliotecas:
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_pages import dataset_for_scale
+from utils.data import DATASET_PATH, prepare_data, read_source, stream_csv
+
+# Quantidade de restaurantes repetidos no final do arquivo, como cópia exata e como nova versão:
+LATE_DUPLICATES = 500
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def with_late_duplicates(seed_path, workdir, n_rows=LATE_DUPLICATES):
+    """Esta função grava o arquivo original com restaurantes repetidos no final.
+
+    Metade das repetições é cópia exata de uma linha e a outra metade é uma versão conflitante
+    (com mais avaliações) do mesmo Restaurant ID.
+
+    Input: Arquivo original, diretório temporário e quantidade de linhas repetidas de cada tipo.
+    Output: Caminho do arquivo gravado.
+    """
+    df_raw = pd.read_csv(seed_path)
+    copias = df_raw.sample(n=n_rows, random_state=42)
+    versoes = df_raw.sample(n=n_rows, random_state=7)
+    versoes = versoes.assign(Votes=versoes["Votes"] + 1)
+
+    path = os.path.join(workdir, "zomato_duplicatas.csv")
+    pd.concat([df_raw, copias, versoes], ignore_index=True).to_csv(path, index=False)
+
+    return path
+
+
+def assert_same_results(obtido, esperado):
+    """Esta função compara o dataframe de stream_csv com o da leitura do CSV inteiro.
+
+    No relatório de duplicatas, a divisão entre cópias exatas e versões conflitantes pode mudar
+    quando um ID tem mais de duas versões (ver stream_csv), então só as linhas removidas e os IDs
+    conflitantes são comparados.
+
+    Input: Dataframes de stream_csv e de prepare_data(read_source).
+    Output: Nenhum (AssertionError na primeira diferença).
+    """
+    pd.testing.assert_frame_equal(obtido, esperado)
+
+    assert obtido.attrs["unknown_codes"] == esperado.attrs["unknown_codes"]
+    for chave in ("linhas", "ids_conflitantes"):
+        assert obtido.attrs["duplicates"][chave] == esperado.attrs["duplicates"][chave], chave
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verificação e benchmark da leitura em blocos")
+    parser.add_argument("--path", default=DATASET_PATH)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1_000, 7_919, 100_000])
+    args = parser.parse_args()
+
+    # Os IDs conflitantes de cada bloco já são comparados em assert_same_results:
+    logging.getLogger("utils.data").setLevel(logging.ERROR)
+
+    n_seed_rows = len(pd.read_csv(args.path))
+
+    print(f"{'arquivo':>12} {'linhas':>12} {'bloco':>9} {'completo (s)':>13} {'blocos (s)':>11}")
+    with tempfile.TemporaryDirectory() as workdir:
+        arquivos = [("duplicatas", with_late_duplicates(args.path, workdir))]
+        arquivos += [
+            (f"{scale}x", dataset_for_scale(args.path, n_seed_rows, scale, workdir))
+            for scale in args.scales
+        ]
+
+        for nome, path in arquivos:
+            inicio = time.perf_counter()
+            esperado = prepare_data(read_source(path))
+            tempo_completo = time.perf_counter() - inicio
+
+            for chunk_size in args.chunk_sizes:
+                inicio = time.perf_counter()
+                obtido = stream_csv(path, chunk_size, os.path.join(workdir, "stream.tmp"))
+                tempo_blocos = time.perf_counter() - inicio
+
+                assert_same_results(obtido, esperado)
+
+                print(
+                    f"{nome:>12} {len(esperado):>12,} {chunk_size:>9,} {tempo_completo:>13.4f}"
+                    f" {tempo_blocos:>11.4f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# Gerador de conjuntos de dados sintéticos no formato do zomato.csv, para testes de escala.
+#
+# Cada linha gerada parte de uma linha "modelo" sorteada do arquivo original (país, cidade,
+# localidade, moeda, faixa de preço, nota, cor e texto da nota continuam coerentes entre si), com
+# Restaurant ID novo, coordenadas deslocadas, votos e custo variados e culinárias sorteadas entre
+# as do mesmo país. Uma parte das linhas é repetida logo em seguida, como as duplicatas do arquivo
+# original. As linhas são geradas em blocos vetorizados e gravadas bloco a bloco, então a memória
+# usada depende do tamanho do bloco e não do tamanho do arquivo.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m benchmarks.synthetic --rows 1000000 --out zomato_1m.csv
+#     python -m benchmarks.synthetic --rows 20000000 --out zomato_20m.parquet --chunk-size 2000000
+
+# Importando as Bibliotecas:
+
+import argparse
+import io
+import os
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.data import COLORS, COUNTRIES, DATASET_PATH
+
+# Parte das linhas que são cópias exatas de outra linha (no zomato.csv: 585 de 7527):
+DUPLICATE_RATE = 0.078
+
+CHUNK_SIZE = 1_000_000
+
+# Desvio padrão do deslocamento das coordenadas (em graus, ~1 km) e do ruído dos votos e custos:
+COORDINATE_JITTER = 0.01
+VOTES_SIGMA = 0.5
+COST_FACTORS = np.array([0.8, 0.9, 1.0, 1.0, 1.0, 1.1, 1.25])
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def build_profile(df_seed):
+    """Esta função prepara as linhas modelo do gerador a partir do arquivo original.
+
+    Só entram as linhas sem duplicatas cujos códigos de país e de cor existem em COUNTRIES e
+    COLORS, então todo código gerado é um código conhecido pelo app.
+
+    Input: Dataframe Sujo original.
+    Output: Dicionário com o dataframe das linhas modelo e, por país, as posições dessas linhas.
+    """
+    df_seed = df_seed.drop_duplicates()
+    df_seed = df_seed.loc[
+        df_seed["Country Code"].isin(COUNTRIES.keys()) & df_seed["Rating color"].isin(COLORS.keys())
+    ].reset_index(drop=True)
+
+    by_country = df_seed.groupby("Country Code").indices
+
+    return {"seed": df_seed, "by_country": by_country}
+
+
+def generate_chunk(profile, n_rows, first_id, rng, duplicate_rate=DUPLICATE_RATE):
+    """Esta função gera um bloco de linhas sintéticas.
+
+    Input: Perfil (build_profile), quantidade de linhas, primeiro Restaurant ID do bloco,
+           gerador de números aleatórios e parte das linhas que são duplicatas.
+    Output: Dataframe Sujo com n_rows linhas e as mesmas colunas do arquivo original.
+    """
+    seed = profile["seed"]
+
+    n_duplicates = int(n_rows * duplicate_rate)
+    n_unique = n_rows - n_duplicates
+
+    # Linhas modelo: país, cidade, endereço, moeda, preço e nota coerentes entre si.
+    templates = rng.integers(0, len(seed), n_unique)
+    chunk = seed.take(templates).reset_index(drop=True)
+
+    chunk["Restaurant ID"] = np.arange(first_id, first_id + n_unique, dtype=np.int64)
+    chunk["Longitude"] += rng.normal(0, COORDINATE_JITTER, n_unique)
+    chunk["Latitude"] += rng.normal(0, COORDINATE_JITTER, n_unique)
+
+    # Votos com cauda longa (restaurantes sem nota continuam com 0 votos):
+    votes = chunk["Votes"].to_numpy() * rng.lognormal(0, VOTES_SIGMA, n_unique)
+    chunk["Votes"] = np.rint(votes).astype(np.int64)
+
+    cost = chunk["Average Cost for two"].to_numpy() * rng.choice(COST_FACTORS, n_unique)
+    chunk["Average Cost for two"] = (np.rint(cost / 10) * 10).astype(np.int64)
+
+    # Culinárias (texto com várias culinárias separadas por vírgula) de outro restaurante do país:
+    countries = chunk["Country Code"].to_numpy()
+    cuisines_source = np.empty(n_unique, dtype=np.int64)
+    for code, positions in profile["by_country"].items():
+        rows = np.flatnonzero(countries == code)
+        cuisines_source[rows] = positions[rng.integers(0, len(positions), len(rows))]
+    chunk["Cuisines"] = seed["Cuisines"].to_numpy()[cuisines_source]
+
+    # Duplicatas exatas, logo depois da linha original como no arquivo original:
+    if n_duplicates:
+        order = np.sort(np.concatenate([np.arange(n_unique), rng.integers(0, n_unique, n_duplicates)]))
+        chunk = chunk.take(order).reset_index(drop=True)
+
+    return chunk
+
+
+def generate_dataset(
+    path,
+    n_rows,
+    seed_path=DATASET_PATH,
+    chunk_size=CHUNK_SIZE,
+    random_state=42,
+    duplicate_rate=DUPLICATE_RATE,
+):
+    """Esta função gera e grava um conjunto de dados sintético em CSV ou Parquet.
+
+    O formato vem da extensão do arquivo: .parquet grava Parquet, qualquer outra grava CSV (com
+    compressão quando a extensão for .gz, .bz2, .zip, .xz ou .zst). No .zip, os blocos são
+    gravados em sequência em um único membro, como read_source espera. O resultado é o mesmo
+    para a mesma semente, qualquer que seja o formato.
+
+    Input: Caminho de saída, quantidade de linhas, arquivo original, tamanho do bloco, semente e
+           parte das linhas que são duplicatas.
+    Output: Caminho do arquivo gravado.
+    """
+    profile = build_profile(pd.read_csv(seed_path))
+    is_parquet = path.endswith(".parquet")
+
+    writer = None
+    arquivo_zip = None
+    csv_zip = None
+    try:
+        for i, start in enumerate(range(0, n_rows, chunk_size)):
+            rng = np.random.default_rng([random_state, i])
+            chunk = generate_chunk(
+                profile, min(chunk_size, n_rows - start), start + 1, rng, duplicate_rate
+            )
+
+            if is_parquet:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            elif path.endswith(".zip"):
+                # Cada to_csv com mode="a" criaria um novo membro com o mesmo nome no arquivo zip:
+                if csv_zip is None:
+                    arquivo_zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+                    membro = arquivo_zip.open(
+                        os.path.basename(path)[: -len(".zip")], "w", force_zip64=True
+                    )
+                    csv_zip = io.TextIOWrapper(membro, encoding="utf-8", newline="")
+                chunk.to_csv(csv_zip, header=i == 0, index=False)
+            else:
+                chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+        if csv_zip is not None:
+            csv_zip.close()
+        if arquivo_zip is not None:
+            arquivo_zip.close()
+
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerador de conjuntos de dados sintéticos")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--out", required=True, help="arquivo .csv, .csv.gz ou .parquet")
+    parser.add_argument("--seed-path", default=DATASET_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--random-state", type=int, default=42)
+    parser.add_argument("--duplicate-rate", type=float, default=DUPLICATE_RATE)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    generate_dataset(
+        args.out,
+        args.rows,
+        args.seed_path,
+        args.chunk_size,
+        args.random_state,
+        args.duplicate_rate,
+    )
+    tempo = time.perf_counter() - inicio
+
+    tamanho = os.path.getsize(args.out) / 2**20
+    print(f"{args.rows:,} linhas gravadas em {args.out} ({tamanho:,.1f} MB) em {tempo:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
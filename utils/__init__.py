@@ -0,0 +1 @@
+# Módulos compartilhados entre as páginas do Fome Zero!
@@ -0,0 +1,239 @@
+# Funções dos gráficos da página de Cidades.
+
+# Importando as Bibliotecas:
+
+import plotly.express as px
+
+from utils.cube import load_cube, load_rating_buckets, select_countries
+from utils.data import DATASET_PATH, decode_categoricals
+from utils.figure_cache import cached_figure
+from utils.perf import timed
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Função Cidades com Mais Restaurantes:
+@timed
+@cached_figure
+def top_ten_cities_restaurants(countries_options, path=DATASET_PATH):
+    """Esta função seleciona os dados dos países escolhidos e cria um gráfico de barras
+    mostrando as dez cidades com mais restaurantes na base de dados.
+
+    Etapas:
+    1 - Filtrar as linhas do cubo de agregados com base nos países selecionados.
+    2 - Selecionar a coluna "Restaurants".
+    3 - Agrupar os dados por país e cidade.
+    4 - Somar a quantidade de restaurantes em cada cidade.
+    5 - Ordenar os resultados pela quantidade de restaurantes em ordem decrescente.
+    6 - Resetar o índice do DataFrame resultante.
+    7 - Criar um gráfico de barras com as dez primeiras cidades com mais restaurantes.
+    8 - Definir a coluna "City" como eixo x, a coluna "Restaurants" como eixo y e a coluna "Country_Name" como cor das barras.
+    9 - Adicionar rótulos nos valores das barras com duas casas decimais.
+    10- Adicionar labels personalizados para os eixos e a cor das barras.
+    11- Adicionar um título ao gráfico.
+    12- Retornar o gráfico resultante.
+
+    Input: Dados dos países, cidades e restaurantes para análise.
+    Output: Gráfico de barras com as top 10 cidades com mais restaurantes.
+    """
+    cube = load_cube(path)
+    # Selecionar os dados no Cubo de Agregados:
+    df_cidades_mais_restaurantes = (
+        select_countries(cube, countries_options)
+        .groupby(["Country_Name", "City"], observed=True)[["Restaurants"]]
+        .sum()
+        .sort_values(["Restaurants"], ascending=False)
+        .reset_index()
+        .pipe(decode_categoricals)
+    )
+    # Desenhar o Gráfico de Linhas:
+    fig = px.bar(
+        df_cidades_mais_restaurantes.head(10),
+        x="City",
+        y="Restaurants",
+        text="Restaurants",
+        text_auto=".2f",
+        color="Country_Name",
+        labels={
+            "City": "Cidade",
+            "Restaurants": "Quantidade de Restaurantes",
+            "Country_Name": "País",
+        },
+    )
+
+    fig.update_layout(
+        title="Top 10 Cidades com mais Restaurantes na Base de Dados", title_x=0.25
+    )
+
+    return fig
+
+
+# Função das Cidades com mais Restaurantes em uma Faixa de Nota:
+def top_cities_by_rating(countries_options, bucket, k, path=DATASET_PATH):
+    """Esta função seleciona as k cidades com mais restaurantes em uma faixa de nota.
+
+    As contagens por (país, cidade, faixa de nota) já estão prontas na tabela de faixas de nota
+    (load_rating_buckets), então a função só filtra as linhas dos países e da faixa escolhidos e
+    faz uma seleção parcial com nlargest, em vez de ordenar todas as cidades.
+
+    Input: Países selecionados no filtro, faixa de nota (RATING_BUCKETS), quantidade de cidades.
+    Output: Dataframe com as colunas Country_Name, City e Aggregate_rating (quantidade de
+            restaurantes na faixa), em ordem decrescente.
+    """
+    rating_buckets = select_countries(load_rating_buckets(path), countries_options)
+
+    df_aux = (
+        rating_buckets.loc[
+            rating_buckets["Rating_bucket"] == bucket, ["Country_Name", "City", "Restaurants"]
+        ]
+        .nlargest(k, "Restaurants")
+        .rename(columns={"Restaurants": "Aggregate_rating"})
+        .reset_index(drop=True)
+        .pipe(decode_categoricals)
+    )
+
+    return df_aux
+
+
+# Função Top 7 Melhores Restaurantes:
+@timed
+@cached_figure
+def best_seven_restaurants(countries_options, path=DATASET_PATH):
+    """Esta função seleciona os dados dos países escolhidos e cria um gráfico de barras mostrando as sete cidades
+    com as maiores médias de avaliação (nota 4 ou superior) entre os restaurantes.
+
+    Etapas:
+    1 - Selecionar, na tabela de faixas de nota, as cidades dos países escolhidos na faixa alta (nota 4 ou superior).
+    2 - Escolher as 7 cidades com mais restaurantes nessa faixa (nlargest, sem ordenar todas as cidades).
+    3 - Usar a contagem de restaurantes de cada cidade feita na criação da tabela.
+    4 - Desenhar um gráfico de barras com as cidades e a quantidade de restaurantes.
+    5 - Personalizar o layout do gráfico, incluindo título e rótulos.
+    6 - Retornar o gráfico resultante.
+
+    Input: Dados dos países, cidades e restaurantes para análise.
+    Output: Gráfico de barras com as top 7 cidades com mais restaurantes com média de avaliação superior a 4.
+    """
+    # Selecionar os dados na Tabela de Faixas de Nota:
+    df_cidades_mais_restaurantes_nota4 = top_cities_by_rating(countries_options, "high", 7, path)
+
+    # Desenhar o Gráfico de Linhas:
+    fig = px.bar(
+        df_cidades_mais_restaurantes_nota4,
+        x="City",
+        y="Aggregate_rating",
+        text="Aggregate_rating",
+        text_auto=".2f",
+        color="Country_Name",
+        labels={
+            "City": "Cidade",
+            "Aggregate_rating": "Quantidade de Restaurantes",
+            "Country_Name": "País",
+        },
+    )
+
+    fig.update_layout(
+        title="Top 7 Cidades com média alta(>4) de avaliação", title_x=0.15
+    )
+
+    return fig
+
+
+# Função Top 7 Piores Restaurantes:
+@timed
+@cached_figure
+def worst_seven_restaurants(countries_options, path=DATASET_PATH):
+    """Esta função seleciona os dados dos países escolhidos e cria um gráfico de barras mostrando as sete cidades
+    com as piores média de avaliação (nota 2.5 ou inferior) entre os restaurantes.
+
+    Etapas:
+    1 - Selecionar, na tabela de faixas de nota, as cidades dos países escolhidos na faixa baixa (nota 2.5 ou inferior).
+    2 - Escolher as 7 cidades com mais restaurantes nessa faixa (nlargest, sem ordenar todas as cidades).
+    3 - Usar a contagem de restaurantes de cada cidade feita na criação da tabela.
+    4 - Desenhar um gráfico de barras com as cidades e a quantidade de restaurantes.
+    5 - Personalizar o layout do gráfico, incluindo título e rótulos.
+    6 - Retornar o gráfico resultante.
+
+    Input: Dados dos países, cidades e restaurantes para análise.
+    Output: Gráfico de barras com as top 7 cidades com mais restaurantes com média de avaliação inferior a 2.5.
+    """
+    # Selecionar os dados na Tabela de Faixas de Nota:
+    df_cidades_mais_restaurantes_nota25 = top_cities_by_rating(countries_options, "low", 7, path)
+
+    # Desenhar o Gráfico de Linhas:
+    fig = px.bar(
+        df_cidades_mais_restaurantes_nota25,
+        x="City",
+        y="Aggregate_rating",
+        text="Aggregate_rating",
+        text_auto=".2f",
+        color="Country_Name",
+        labels={
+            "City": "Cidade",
+            "Aggregate_rating": "Quantidade de Restaurantes",
+            "Country_Name": "País",
+        },
+    )
+
+    fig.update_layout(
+        title="Top 7 Cidades com média baixa(<2.5) de avaliação", title_x=0.15
+    )
+
+    return fig
+
+
+# Função Top 10 Cidades com mais Restaurantes de Culinárias distintas:
+
+
+@timed
+@cached_figure
+def top_ten_cities_unique_cuisines(countries_options, path=DATASET_PATH):
+    """Esta função seleciona os dados das cidades com o maior número de tipos únicos de culinária em países específicos.
+    Em seguida, cria um gráfico de barras mostrando as 10 principais cidades e a quantidade de restaurantes com culinárias únicas.
+
+    Etapas:
+    1 - Selecionar os dados das colunas "Country_Name", "City" e "Cuisines" no cubo de agregados.
+    2 - Filtrar os dados dos países selecionados.
+    3 - Agrupar os dados por país e cidade e contar o número de tipos únicos de culinária em cada cidade.
+    4 - Ordenar os dados em ordem decrescente com base na quantidade de tipos únicos de culinária.
+    5 - Resetar o índice dos dados.
+    6 - Desenhar um gráfico de barras com as cidades e a quantidade de restaurantes com tipos únicos de culinária.
+    7 - Personalizar o layout do gráfico, incluindo título e rótulos.
+    8 - Retornar o gráfico resultante.
+
+    Input: Dados dos países, cidades, restaurantes e tipos de culinária para análise.
+    Output: Gráfico de barras com as top 10 cidades com mais restaurantes de tipo de culinária única.
+    """
+    cube = load_cube(path)
+    # Selecionar os dados no Cubo de Agregados:
+    cidades_maior_tipos_culinaria = (
+        select_countries(cube, countries_options)
+        .loc[:, ["Country_Name", "City", "Cuisines"]]
+        .groupby(["Country_Name", "City"], observed=True)
+        .nunique()
+        .sort_values(["Cuisines"], ascending=False)
+        .reset_index()
+        .pipe(decode_categoricals)
+    )
+
+    # Desenhar o Gráfico de Linhas:
+    fig = px.bar(
+        cidades_maior_tipos_culinaria.head(10),
+        x="City",
+        y="Cuisines",
+        text="Cuisines",
+        color="Country_Name",
+        labels={
+            "City": "Cidade",
+            "Cuisines": "Quantidade de Restaurantes com Culinárias Únicas",
+            "Country_Name": "País",
+        },
+    )
+
+    fig.update_layout(
+        title="Top 10 Cidades com mais Restaurantes com Tipos Únicos de Culinária",
+        title_x=0.20,
+    )
+
+    return fig
@@ -0,0 +1,248 @@
+# Funções dos gráficos da página de Países.
+
+# Importando as Bibliotecas:
+
+import plotly.express as px
+import streamlit as st
+
+from utils.cube import load_cube, select_countries
+from utils.data import DATASET_PATH, dataset_version
+from utils.figure_cache import cached_figure
+from utils.perf import timed
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _country_summary(path, version, countries):
+    summary = (
+        select_countries(load_cube(path), countries)
+        .groupby("Country_Name", observed=True)
+        .agg(
+            Restaurants=("Restaurants", "sum"),
+            Cities=("City", "nunique"),
+            Votes_sum=("Votes_sum", "sum"),
+            Cost_for_two_sum=("Cost_for_two_sum", "sum"),
+        )
+    )
+    summary["Votes_mean"] = summary["Votes_sum"] / summary["Restaurants"]
+    summary["Cost_for_two_mean"] = summary["Cost_for_two_sum"] / summary["Restaurants"]
+
+    return summary.reset_index()
+
+
+# Função do resumo por país:
+@timed
+def country_summary(countries_options, path=DATASET_PATH):
+    """Esta função cria a tabela de resumo por país usada por todos os gráficos da página.
+
+    Uma única agregação nomeada sobre as linhas do cubo dos países escolhidos calcula, por país,
+    a quantidade de restaurantes, de cidades distintas, a soma e a média de votos e a média de
+    preço do prato para dois. A tabela fica em cache pela versão do conjunto de dados e pelos
+    países selecionados, então os quatro gráficos de uma execução compartilham a mesma agregação.
+    Uma nova métrica por país entra como mais uma coluna da agregação, sem uma nova varredura.
+
+    Input: Países selecionados no filtro.
+    Output: Dataframe com uma linha por país (em ordem alfabética) e as colunas Restaurants,
+            Cities, Votes_sum, Cost_for_two_sum, Votes_mean e Cost_for_two_mean.
+    """
+    countries = tuple(sorted(set(countries_options)))
+    return _country_summary(path, dataset_version(path), countries)
+
+
+# Função da quantidade de restaurantes por cidades:
+@timed
+@cached_figure
+def restaurants_by_countries(countries_options, path=DATASET_PATH):
+    """Esta função cria um gráfico da quantidade de restaurantes registrados por país.
+
+    Assim, calcula quantos restaurantes por país existentes no DataFrame. Ela realiza as seguintes etapas:
+    1 - Seleciona a quantidade de restaurantes no resumo por país (country_summary).
+    2 - Mantém uma linha por país, com quantos restaurantes existem em cada país.
+    3 - Classifica os resultados em ordem decrescente com base na quantidade de restaurantes.
+    4 - Renomeia as colunas para "Países" e "Quantidade de Restaurantes".
+    5 - Cria um gráfico de barras usando a biblioteca Plotly Express, onde os países são exibidos no eixo x e a quantidade de restaurantes no eixo y.
+    6 - Adiciona um título ao gráfico.
+    7 - Adiciona os valores da quantidade de restaurantes dentro das barras do gráfico.
+    8 - Retorna o gráfico resultante.
+
+
+    Input: Dados da quantidade de restaurantes por país.
+    Output: Gráfico de barras com os valores encontrados.
+    """
+    # Seleção de Colunas no Resumo por País
+    df_aux = (
+        country_summary(countries_options, path)
+        .loc[:, ["Country_Name", "Restaurants"]]
+        .sort_values(["Restaurants"], ascending=False)
+    )
+
+    # Alterar os nomes das colunas
+    df_aux = df_aux.rename(
+        columns={
+            "Country_Name": "Países",
+            "Restaurants": "Quantidade de Restaurantes",
+        }
+    )
+
+    # Desenhar o Gráfico de Linhas
+    fig = px.bar(df_aux, x="Países", y="Quantidade de Restaurantes")
+
+    # Adicionar um título ao gráfico
+    fig.update_layout(
+        title="Quantidade de Restaurantes Registrados por País", title_x=0.33
+    )
+
+    #  Adicionar os valores dentro das barras
+    fig.update_traces(text=df_aux["Quantidade de Restaurantes"], textposition="auto")
+
+    return fig
+
+
+# Função da quantidade de cidades por país:
+
+
+@timed
+@cached_figure
+def cities_by_countries(countries_options, path=DATASET_PATH):
+    """Essa função calcula e exibe um gráfico de barras mostrando a quantidade de cidades registradas por país..
+
+    Assim, calcula quantos restaurantes por cidades que existem no DataFrame. Ela realiza as seguintes etapas:
+    1 - Selecionar as colunas "Country_Name" e "Cities" do resumo por país (country_summary).
+    2 - Manter uma linha por país.
+    3 - Usar a contagem de cidades únicas de cada país ("nunique" na agregação do resumo).
+    4 - Ordenar o DataFrame resultante em ordem decrescente com base na quantidade de cidades.
+    5 - Renomear as colunas do DataFrame para "Países" e "Quantidade de Cidades".
+    6 - Utilizar a biblioteca Plotly Express para criar um gráfico de barras.
+    7 - Configurar o eixo x do gráfico para representar os países e o eixo y para representar a quantidade de cidades.
+    8 - Adicionar um título ao gráfico.
+    9 - Inserir os valores de quantidade de cidades dentro das barras do gráfico.
+    10 - Retornar o objeto gráfico resultante.
+
+    Input: Dados da quantidade de restaurantes por cidades.
+    Output: Gráfico de barras com os valores encontrados.
+    """
+    # Seleção de Colunas no Resumo por País
+    df_aux = (
+        country_summary(countries_options, path)
+        .loc[:, ["Country_Name", "Cities"]]
+        .sort_values(["Cities"], ascending=False)
+    )
+
+    # Alterar os nomes das colunas
+    df_aux = df_aux.rename(
+        columns={
+            "Country_Name": "Países",
+            "Cities": "Quantidade de Cidades",
+        }
+    )
+
+    # Desenhar o Gráfico de Linhas
+    fig = px.bar(df_aux, x="Países", y="Quantidade de Cidades")
+
+    # Adicionar um título ao gráfico
+    fig.update_layout(title="Quantidade de Cidades Registradas por País", title_x=0.33)
+
+    #  Adicionar os valores dentro das barras
+    fig.update_traces(text=df_aux["Quantidade de Cidades"], textposition="auto")
+
+    return fig
+
+
+# Função Média de Avaliações por país:
+@timed
+@cached_figure
+def avg_ratings_by_countries(countries_options, path=DATASET_PATH):
+    """Essa função calcula a média de avaliações por país a partir de um DataFrame.
+
+    Ela realiza as seguintes etapas:
+    1 - Selecionar a média de votos por restaurante no resumo por país (country_summary).
+    2 - Manter uma linha por país.
+    3 - A média já vem da agregação do resumo: soma total de votos dividida pela quantidade de restaurantes.
+    4 - Arredondar a média de avaliações por país para duas casas decimais.
+    5 - Renomear as colunas do DataFrame para "Países" e "Quantidade de Avaliações".
+    6 - Ordenar o DataFrame em ordem decrescente com base na quantidade de avaliações.
+    7 - Utilizar a biblioteca Plotly Express para criar um gráfico de barras.
+    8 - Configurar o eixo x do gráfico para representar os países e o eixo y para representar a quantidade de avaliações.
+
+    Input: Dados da média de avaliações por país.
+    Output: Gráfico de barras com os valores encontrados.
+    """
+    # Seleção de Colunas no Resumo por País
+    df_aux = country_summary(countries_options, path).loc[:, ["Country_Name", "Votes_mean"]]
+    df_aux["paises_media"] = round(df_aux["Votes_mean"], 2)
+
+    # Alterar os nomes das colunas
+    df_aux = df_aux.rename(
+        columns={
+            "Country_Name": "Países",
+            "paises_media": "Quantidade de Avaliações",
+        }
+    ).sort_values(["Quantidade de Avaliações"], ascending=False)
+
+    # Desenhar o Gráfico de Linhas
+    fig = px.bar(df_aux, x="Países", y="Quantidade de Avaliações")
+
+    # Adicionar um título ao gráfico
+    fig.update_layout(title="Média  de Avaliações por País", title_x=0.33)
+
+    #  Adicionar os valores dentro das barras
+    fig.update_traces(text=df_aux["Quantidade de Avaliações"], textposition="auto")
+
+    return fig
+
+
+# Função da Média de Preço p/ Prato p/ Dois:
+@timed
+@cached_figure
+def plate_for_two_by_countries(countries_options, path=DATASET_PATH):
+    """Essa função calcula a média de preço dos pratos para duas pessoas por país a partir de um DataFrame.
+
+    Ela realiza as seguintes etapas:
+    1 - Selecionar a média de preço do prato para dois no resumo por país (country_summary).
+    2 - Manter uma linha por país.
+    3 - A média já vem da agregação do resumo: soma dos preços dividida pela quantidade de restaurantes.
+    4 - Arredondar os valores da média para duas casas decimais.
+    5 - Ordenar os resultados pela média de preço dos pratos em ordem decrescente.
+    6 - Renomear as colunas para "Países" e "Média de Preço dos Pratos".
+    7 - Criar um gráfico de barras com os países no eixo x e a média de preço dos pratos no eixo y.
+    8 - Adicionar um título ao gráfico.
+    9 - Adicionar os valores da média de preço dos pratos dentro das barras.
+    10 -Retornar o gráfico resultante.
+
+    Input: Dados da média de preço dos pratos para duas pessos por país.
+    Output: Gráfico de barras com os valores encontrados.
+    """
+    # Seleção de Colunas no Resumo por País
+    df_aux = country_summary(countries_options, path).rename(
+        columns={"Cost_for_two_mean": "Average_Cost_for_two"}
+    )
+    df_aux = round(
+        df_aux[["Country_Name", "Average_Cost_for_two"]]
+        .sort_values(["Average_Cost_for_two"], ascending=False)
+        .reset_index(drop=True),
+        2,
+    )
+
+    # Alterar os nomes das colunas
+    df_aux = df_aux.rename(
+        columns={
+            "Country_Name": "Países",
+            "Average_Cost_for_two": "Média de Preço dos Pratos",
+        }
+    )
+
+    # Desenhar o Gráfico de Linhas
+    fig = px.bar(df_aux, x="Países", y="Média de Preço dos Pratos")
+
+    # Adicionar um título ao gráfico
+    fig.update_layout(
+        title="Média de Preço dos Prato para Duas Pessoas por País", title_x=0.33
+    )
+
+    #  Adicionar os valores dentro das barras
+    fig.update_traces(text=df_aux["Média de Preço dos Pratos"], textposition="auto")
+
+    return fig
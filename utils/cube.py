@@ -0,0 +1,128 @@
+# Importando as Bibliotecas:
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data import DATASET_PATH, VERSION_CACHE_ENTRIES, dataset_version, load_data
+from utils.perf import timed
+from utils.sql_backend import query_backend, query_cube, query_rating_buckets
+
+# Mínimo de avaliações para um restaurante entrar nas médias por tipo de culinária:
+MIN_VOTES = 150
+
+# Faixas de nota (pd.cut, intervalos fechados à esquerda): baixa até 2.5, média e alta a partir de 4:
+RATING_BINS = [-np.inf, np.nextafter(2.5, np.inf), 4.0, np.inf]
+RATING_BUCKETS = ["low", "mid", "high"]
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Função de Criação do Cubo de Agregados:
+def build_cube(df):
+    """Esta função cria o cubo de agregados no grão (país, cidade, culinária).
+
+    Cada linha do cubo guarda, para uma combinação de país, cidade e culinária:
+    - Restaurants: quantidade de restaurantes
+    - Votes_sum: soma das avaliações (votos)
+    - Cost_for_two_sum: soma do preço médio do prato para dois
+
+    Os gráficos somam (roll-up) as linhas dos países selecionados, assim o custo de cada
+    gráfico depende da quantidade de grupos e não da quantidade de restaurantes.
+
+    Input: Dataframe Limpo e Enriquecido
+    Output: Cubo de agregados
+    """
+    df_aux = df[["Country_Name", "City", "Cuisines"]].assign(
+        Restaurants=1,
+        Votes_sum=df["Votes"],
+        Cost_for_two_sum=df["Average_Cost_for_two"],
+    )
+
+    cube = (
+        df_aux.groupby(["Country_Name", "City", "Cuisines"], observed=True)
+        .sum()
+        .reset_index()
+    )
+
+    return cube
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_cube(path, version, backend):
+    if backend == "duckdb":
+        return query_cube(path)
+    return build_cube(load_data(path))
+
+
+@timed
+def load_cube(path=DATASET_PATH):
+    """Esta função retorna o cubo de agregados, criado uma única vez por versão do conjunto de dados.
+
+    Com FOME_ZERO_QUERY_BACKEND=duckdb, o cubo é calculado com SQL sobre o snapshot Parquet
+    (utils/sql_backend.py), com o mesmo resultado.
+
+    Input: Caminho do arquivo de dados.
+    Output: Cubo de agregados (compartilhado, somente leitura).
+    """
+    return _load_cube(path, dataset_version(path), query_backend())
+
+
+# Função de Criação das Faixas de Nota por Cidade:
+def build_rating_buckets(df):
+    """Esta função conta os restaurantes de cada cidade por faixa de nota, em uma única passada.
+
+    A nota de avaliação é dividida nas faixas RATING_BUCKETS com pd.cut e os restaurantes são
+    contados por (país, cidade, faixa). Os gráficos das cidades com mais restaurantes de nota
+    alta ou baixa usam essa tabela, cujo tamanho depende da quantidade de cidades e não da
+    quantidade de restaurantes.
+
+    Input: Dataframe Limpo e Enriquecido
+    Output: Tabela com as colunas Country_Name, City, Rating_bucket e Restaurants
+    """
+    bucket = pd.cut(
+        df["Aggregate_rating"], bins=RATING_BINS, labels=RATING_BUCKETS, right=False
+    )
+
+    rating_buckets = (
+        df[["Country_Name", "City"]]
+        .assign(Rating_bucket=bucket)
+        .groupby(["Country_Name", "City", "Rating_bucket"], observed=True)
+        .size()
+        .rename("Restaurants")
+        .reset_index()
+    )
+
+    return rating_buckets
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_rating_buckets(path, version, backend):
+    if backend == "duckdb":
+        return query_rating_buckets(path, RATING_BINS, RATING_BUCKETS)
+    return build_rating_buckets(load_data(path))
+
+
+@timed
+def load_rating_buckets(path=DATASET_PATH):
+    """Esta função retorna as faixas de nota por cidade, criadas uma única vez por versão dos dados.
+
+    Com FOME_ZERO_QUERY_BACKEND=duckdb, a tabela é calculada com SQL sobre o snapshot Parquet
+    (utils/sql_backend.py), com o mesmo resultado.
+
+    Input: Caminho do arquivo de dados.
+    Output: Tabela de faixas de nota por cidade (compartilhada, somente leitura).
+    """
+    return _load_rating_buckets(path, dataset_version(path), query_backend())
+
+
+def select_countries(cube, countries_options):
+    """Esta função seleciona as linhas do cubo dos países escolhidos.
+
+    Input: Cubo de agregados e lista de países selecionados.
+    Output: Linhas do cubo dos países selecionados.
+    """
+    return cube.loc[cube["Country_Name"].isin(countries_options), :]
@@ -0,0 +1,210 @@
+# Índice de todas as culinárias de cada restaurante (e não só da primeira culinária).
+
+# Importando as Bibliotecas:
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.cube import MIN_VOTES
+from utils.data import (
+    DATASET_PATH,
+    NEGATIVE_CUISINES,
+    VERSION_CACHE_ENTRIES,
+    dataset_version,
+    load_data,
+)
+from utils.perf import timed
+from utils.sql_backend import query_backend, query_cuisine_cube
+
+# Separador das culinárias no texto da coluna All_Cuisines ("Italian, Pizza, Cafe"):
+CUISINE_SEPARATOR = ","
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Função de Separação das culinárias de um texto:
+def split_cuisines(text):
+    """Esta função separa o texto com as culinárias de um restaurante em uma lista.
+
+    Os espaços em volta de cada nome são retirados e nomes vazios ou repetidos ficam de fora,
+    assim como as culinárias de NEGATIVE_CUISINES.
+
+    Input: Texto com as culinárias separadas por vírgula.
+    Output: Lista com as culinárias, na ordem do texto.
+    """
+    nomes = (nome.strip() for nome in text.split(CUISINE_SEPARATOR))
+    return [nome for nome in dict.fromkeys(nomes) if nome and nome not in NEGATIVE_CUISINES]
+
+
+# Função de Criação do Índice de Culinárias:
+def build_cuisine_index(df):
+    """Esta função cria o índice restaurante -> culinárias no formato CSR (offsets e códigos).
+
+    As culinárias da linha i ficam em codes[offsets[i]:offsets[i + 1]], como códigos do
+    vocabulário 'cuisines'. O texto só é separado para os valores distintos da coluna categórica
+    All_Cuisines (as combinações de culinárias), e as linhas recebem os códigos da sua combinação
+    com np.repeat, sem criar uma linha do dataframe por culinária (explode). O índice ocupa
+    8 bytes por restaurante e 4 bytes por par (restaurante, culinária).
+
+    Input: Dataframe Limpo e Enriquecido
+    Output: Dicionário com:
+            - cuisines: vocabulário das culinárias (pd.Index em ordem alfabética)
+            - offsets: início das culinárias de cada linha (len(df) + 1 posições)
+            - codes: código no vocabulário de cada par (restaurante, culinária)
+    """
+    col = df["All_Cuisines"]
+    combinacoes = [split_cuisines(texto) for texto in col.cat.categories]
+    cuisines = pd.Index(sorted({nome for nomes in combinacoes for nome in nomes}))
+
+    # Índice CSR das combinações, e cada linha recebe as culinárias da sua combinação:
+    tamanhos = [len(nomes) for nomes in combinacoes]
+    combinacoes_index = {
+        "cuisines": cuisines,
+        "offsets": np.concatenate([[0], np.cumsum(tamanhos)]).astype(np.int64),
+        "codes": cuisines.get_indexer([nome for nomes in combinacoes for nome in nomes]).astype(
+            np.int32
+        ),
+    }
+    index = take_rows(combinacoes_index, col.cat.codes.to_numpy())
+
+    for array in [index["offsets"], index["codes"]]:
+        array.flags.writeable = False
+
+    return index
+
+
+def take_rows(index, positions):
+    """Esta função seleciona as linhas de um índice CSR, na ordem das posições informadas.
+
+    Input: Índice CSR (cuisines, offsets, codes) e posições das linhas.
+    Output: Índice CSR com uma linha por posição, com o mesmo vocabulário.
+    """
+    offsets = index["offsets"]
+    contagens = offsets[1:][positions] - offsets[:-1][positions]
+    novos_offsets = np.concatenate([[0], np.cumsum(contagens)]).astype(np.int64)
+
+    # Posição de cada par no array de códigos original: início da linha + posição dentro dela.
+    origem = np.repeat(offsets[:-1][positions] - novos_offsets[:-1], contagens)
+    origem += np.arange(novos_offsets[-1], dtype=np.int64)
+
+    return {"cuisines": index["cuisines"], "offsets": novos_offsets, "codes": index["codes"][origem]}
+
+
+def pair_rows(index):
+    """Esta função retorna a linha de cada par (restaurante, culinária) do índice CSR.
+
+    Input: Índice CSR.
+    Output: Array com a posição da linha de cada código de 'codes'.
+    """
+    offsets = index["offsets"]
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def rows_by_cuisine(index):
+    """Esta função inverte o índice CSR: para cada culinária, as posições das suas linhas.
+
+    As posições vêm de uma única ordenação estável dos códigos, então cada array já vem em
+    ordem crescente de posição, como em build_column_index.
+
+    Input: Índice CSR.
+    Output: Dicionário {culinária: array com as posições das linhas}.
+    """
+    codes = index["codes"]
+    linhas = pair_rows(index)
+    ordem = np.argsort(codes, kind="stable")
+    limites = np.searchsorted(codes[ordem], np.arange(len(index["cuisines"]) + 1))
+
+    rows = {}
+    for i, culinaria in enumerate(index["cuisines"]):
+        posicoes = linhas[ordem[limites[i] : limites[i + 1]]]
+        posicoes.flags.writeable = False
+        rows[culinaria] = posicoes
+
+    return rows
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_cuisine_index(path, version):
+    return build_cuisine_index(load_data(path))
+
+
+@timed
+def load_cuisine_index(path=DATASET_PATH):
+    """Esta função retorna o índice de culinárias, criado uma única vez por versão do conjunto de dados.
+
+    Input: Caminho do arquivo de dados.
+    Output: Índice CSR das culinárias de cada linha do dataframe (compartilhado, somente leitura).
+    """
+    return _load_cuisine_index(path, dataset_version(path))
+
+
+# Função de Criação do Cubo de Culinárias por País:
+def build_cuisine_cube(df, index):
+    """Esta função cria os agregados no grão (país, culinária), contando todas as culinárias.
+
+    Um restaurante "Italian, Pizza" conta uma vez em Italian e uma vez em Pizza. As somas são
+    feitas com np.bincount sobre os pares (restaurante, culinária) do índice CSR, com a chave
+    país * quantidade de culinárias + culinária, sem criar um dataframe com uma linha por par.
+
+    Cada linha guarda:
+    - Restaurants: quantidade de restaurantes
+    - Restaurants_min_votes e Rating_sum_min_votes: quantidade de restaurantes com pelo menos
+      MIN_VOTES avaliações e a soma das suas notas
+
+    Input: Dataframe Limpo e Enriquecido e índice de culinárias.
+    Output: Tabela com as colunas Country_Name, Cuisines e os agregados.
+    """
+    countries = df["Country_Name"].cat.categories
+    cuisines = index["cuisines"]
+
+    linhas = pair_rows(index)
+    chave = df["Country_Name"].cat.codes.to_numpy().astype(np.int64)[linhas] * len(cuisines)
+    chave += index["codes"]
+
+    min_votes = df["Votes"].to_numpy() >= MIN_VOTES
+    rating = df["Aggregate_rating"].to_numpy()
+    tamanho = len(countries) * len(cuisines)
+
+    restaurantes = np.bincount(chave, minlength=tamanho)
+    grupos = np.flatnonzero(restaurantes)
+    pais, culinaria = np.divmod(grupos, len(cuisines))
+
+    cuisine_cube = pd.DataFrame(
+        {
+            "Country_Name": pd.Categorical.from_codes(pais, countries, ordered=True),
+            "Cuisines": pd.Categorical.from_codes(culinaria, cuisines, ordered=True),
+            "Restaurants": restaurantes[grupos],
+            "Restaurants_min_votes": np.bincount(
+                chave, weights=min_votes[linhas], minlength=tamanho
+            )[grupos].astype(np.int64),
+            "Rating_sum_min_votes": np.bincount(
+                chave, weights=np.where(min_votes, rating, 0.0)[linhas], minlength=tamanho
+            )[grupos],
+        }
+    )
+
+    return cuisine_cube
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_cuisine_cube(path, version, backend):
+    if backend == "duckdb":
+        return query_cuisine_cube(path, MIN_VOTES)
+    return build_cuisine_cube(load_data(path), _load_cuisine_index(path, version))
+
+
+@timed
+def load_cuisine_cube(path=DATASET_PATH):
+    """Esta função retorna o cubo de culinárias por país, criado uma única vez por versão dos dados.
+
+    Com FOME_ZERO_QUERY_BACKEND=duckdb, o cubo é calculado com SQL sobre o snapshot Parquet
+    (utils/sql_backend.py), com o mesmo resultado.
+
+    Input: Caminho do arquivo de dados.
+    Output: Cubo de culinárias por país (compartilhado, somente leitura).
+    """
+    return _load_cuisine_cube(path, dataset_version(path), query_backend())
@@ -0,0 +1,184 @@
+# Funções dos gráficos e tabelas da página de Culinárias.
+
+# Importando as Bibliotecas:
+
+import numpy as np
+import plotly.express as px
+import streamlit as st
+
+from utils.cube import select_countries
+from utils.cuisine_index import load_cuisine_cube, load_cuisine_index, pair_rows
+from utils.data import DATASET_PATH, VERSION_CACHE_ENTRIES, dataset_version, load_data
+from utils.figure_cache import cached_figure
+from utils.perf import timed
+from utils.ranking import top_ranked
+
+# Colunas dos restaurantes exibidas nas métricas por culinária:
+METRIC_COLUMNS = [
+    "Restaurant_ID",
+    "Restaurant_Name",
+    "Country_Name",
+    "City",
+    "Cuisines",
+    "All_Cuisines",
+    "Average_Cost_for_two",
+    "Currency",
+    "Aggregate_rating",
+    "Votes",
+]
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Função de Criação dos Melhores e Piores Restaurantes por Culinária:
+def build_best_per_cuisine(df, index):
+    """Esta função encontra o melhor e o pior restaurante de todas as culinárias de uma só vez.
+
+    Os pares (restaurante, culinária) do índice de culinárias são ordenados uma única vez por
+    culinária, nota (decrescente) e Restaurant_ID (crescente) com np.lexsort. O primeiro par de
+    cada culinária é o melhor restaurante e o último par entre os restaurantes avaliados é o pior
+    (os "Not rated", com nota 0, ficam de fora). Um restaurante "Italian, Pizza" concorre nas
+    duas culinárias. Só as linhas escolhidas são copiadas com as colunas de METRIC_COLUMNS.
+
+    Input: Dataframe Limpo e Enriquecido e índice de culinárias.
+    Output: Dicionário {"best": {culinária: restaurante}, "worst": {culinária: restaurante}},
+            em que cada restaurante é um dicionário com as colunas de METRIC_COLUMNS.
+    """
+    linhas = pair_rows(index)
+    rating = df["Aggregate_rating"].to_numpy()[linhas]
+    ordem = np.lexsort((df["Restaurant_ID"].to_numpy()[linhas], -rating, index["codes"]))
+    avaliados = ordem[rating[ordem] > 0]
+
+    # Primeiro par de cada culinária (melhor) e último par avaliado de cada culinária (pior):
+    codes = index["codes"][ordem]
+    best = ordem[np.diff(codes, prepend=-1) != 0]
+    codes = index["codes"][avaliados]
+    worst = avaliados[np.diff(codes, append=len(index["cuisines"])) != 0]
+
+    restaurants = {}
+    for kind, pares in (("best", best), ("worst", worst)):
+        rows = df.iloc[linhas[pares]].loc[:, METRIC_COLUMNS]
+        cuisines = index["cuisines"][index["codes"][pares]]
+        restaurants[kind] = dict(zip(cuisines, rows.to_dict("records")))
+
+    return restaurants
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_best_per_cuisine(path, version):
+    return build_best_per_cuisine(load_data(path), load_cuisine_index(path))
+
+
+# Função dos Melhores (ou Piores) Restaurantes das Culinárias escolhidas:
+@timed
+def best_per_cuisine(cuisines_options, kind="best", path=DATASET_PATH):
+    """Esta função retorna o melhor (ou o pior) restaurante de cada culinária escolhida.
+
+    Os restaurantes de todas as culinárias são calculados uma única vez por versão do conjunto
+    de dados (build_best_per_cuisine), considerando todas as culinárias de cada restaurante,
+    então escolher mais culinárias é só uma consulta a mais no dicionário, sem novos filtros nem
+    ordenações.
+
+    Input: Culinárias escolhidas, "best" ou "worst".
+    Output: Dicionário {culinária: restaurante} na ordem das culinárias escolhidas (as culinárias
+            sem restaurantes ficam de fora).
+    """
+    restaurants = _load_best_per_cuisine(path, dataset_version(path))[kind]
+
+    return {
+        cuisine: restaurants[cuisine] for cuisine in cuisines_options if cuisine in restaurants
+    }
+
+
+# Função Top 20 Melhores Restaurantes entre os Países e Culinárias Selecionadas
+@timed
+def top_best_restaurants(countries_options, top_n, cuisines_options, path=DATASET_PATH):
+    """Esta função cria a tabela dos top_n restaurantes com as maiores notas entre os países e culinárias selecionados.
+
+    Somente restaurantes com pelo menos MIN_VOTES avaliações entram, ordenados por nota e votos.
+    A busca usa o índice de ranking (top_ranked), que para após top_n restaurantes, e cada linha
+    da tabela é a linha de um único restaurante; redes aparecem uma vez, com a melhor unidade.
+    Um restaurante entra quando qualquer uma das suas culinárias foi selecionada, e a coluna
+    Cuisines da tabela mostra todas as culinárias dele.
+
+    Input: Países selecionados, quantidade de restaurantes e culinárias selecionadas.
+    Output: Dataframe com os top_n restaurantes.
+    """
+    df = load_data(path)
+
+    restaurante_maior_nota_media = (
+        df.take(top_ranked(countries_options, cuisines_options, top_n, path))
+        .loc[
+            :,
+            [
+                "Restaurant_Name",
+                "Country_Name",
+                "City",
+                "All_Cuisines",
+                "Aggregate_rating",
+                "Votes",
+            ],
+        ]
+        .rename(columns={"All_Cuisines": "Cuisines"})
+        .reset_index(drop=True)
+    )
+    return restaurante_maior_nota_media
+
+
+# Função Top 10 Melhores/Piores Tipos de Culinária:
+
+
+@timed
+@cached_figure
+def top_types_cuisines(countries_options, top_n, top_asc, path=DATASET_PATH):
+    """Esta função seleciona os dados de tipos de culinária com pelo menos MIN_VOTES votos,
+    calcula a média de avaliação agregada para cada tipo de culinária, classifica os tipos de
+    culinária com base na média em ordem ascendente ou descendente e retorna um gráfico de barras
+    dos 10 melhores ou piores tipos de culinária.
+
+    Etapas:
+    1 - Selecionar os dados no cubo de culinárias por país, considerando apenas os restaurantes
+        com pelo menos MIN_VOTES votos (cada restaurante conta em todas as suas culinárias).
+    2 - Agrupar os dados pela coluna "Cuisines".
+    3 - Calcular a média da avaliação agregada para cada tipo de culinária (soma das notas / quantidade de restaurantes).
+    4 - Classificar os tipos de culinária com base na média da avaliação agregada, em ordem ascendente ou descendente, dependendo do parâmetro "top_asc".
+    5 - Resetar o índice do dataframe resultante.
+    6 - Desenhar um gráfico de barras com os 10 melhores ou piores tipos de culinária, dependendo do parâmetro "top_asc".
+    7 - Configurar as legendas e rótulos do gráfico.
+    8 - Retornar o gráfico.
+
+    Input: Dados dos países, cidades, restaurantes e tipos de culinária para análise.
+    Output: Gráfico de barras dos 10 melhores ou piores tipos de culinária nos países selecionados.
+    """
+    cube = load_cuisine_cube(path)
+
+    # Selecionando os dados no Cubo de Culinárias (restaurantes com pelo menos MIN_VOTES votos):
+    culinarias = (
+        select_countries(cube, countries_options)
+        .groupby("Cuisines", observed=True)[["Rating_sum_min_votes", "Restaurants_min_votes"]]
+        .sum()
+        .query("Restaurants_min_votes > 0")
+    )
+    culinaria_media = round(
+        (culinarias["Rating_sum_min_votes"] / culinarias["Restaurants_min_votes"])
+        .to_frame("Aggregate_rating")
+        .sort_values(["Aggregate_rating"], ascending=top_asc)
+        .reset_index()
+        .head(top_n),
+        2,
+    )
+
+    # Desenhar o Gráfico de Linhas:
+    fig = px.bar(
+        culinaria_media.head(top_n),
+        x="Cuisines",
+        y="Aggregate_rating",
+        text="Aggregate_rating",
+        labels={
+            "Cuisines": "Tipo de Culinária",
+            "Aggregate_rating": "Média de Avaliações",
+        },
+    )
+    return fig
@@ -0,0 +1,1116 @@
+# Importando as Bibliotecas:
+
+import hashlib
+import logging
+import lzma
+import os
+import shutil
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import streamlit as st
+
+from utils.perf import stage, timed
+from utils.snapshot import (
+    BASE_HASH_KEY,
+    COMPRESSED_EXTENSIONS,
+    DELTAS_KEY,
+    PREVIOUS_HASH_KEY,
+    SOURCE_HASH_KEY,
+    read_column,
+    read_snapshot,
+    snapshot_metadata,
+    snapshot_path,
+    snapshot_source,
+    write_chunks,
+    write_snapshot,
+)
+
+# Caminho padrão do conjunto de dados. A variável de ambiente FOME_ZERO_DATASET escolhe outro
+# arquivo, que pode estar comprimido (ex.: FOME_ZERO_DATASET=dataset/zomato.csv.zip):
+DATASET_ENV_VAR = "FOME_ZERO_DATASET"
+DATASET_PATH = os.environ.get(DATASET_ENV_VAR) or "zomato.csv"
+
+# Leitura do CSV em blocos de FOME_ZERO_CHUNK_SIZE linhas (streaming), para catálogos que não
+# cabem com folga na memória. Sem a variável (ou com 0), o CSV é lido inteiro de uma vez:
+CHUNK_SIZE_ENV_VAR = "FOME_ZERO_CHUNK_SIZE"
+
+# Versões do conjunto de dados mantidas em cada cache indexado pela versão (a atual e a anterior,
+# ainda em uso pelas sessões abertas durante a ingestão de um delta). Sem o limite, cada delta
+# ingerido deixaria o dataframe antigo e as estruturas criadas a partir dele na memória:
+VERSION_CACHE_ENTRIES = 2
+
+# Versão do esquema de limpeza/enriquecimento. Deve ser incrementada a cada alteração em
+# clean_code ou enrich_data, para invalidar os snapshots Parquet já gravados:
+SCHEMA_VERSION = 8
+
+# Esquema declarado do arquivo de origem: as colunas lidas, na ordem do CSV, já com os seus tipos.
+# Fica de fora somente 'Switch to order menu' (sempre vazia):
+SOURCE_SCHEMA = {
+    "Restaurant ID": "int64",
+    "Restaurant Name": "object",
+    "Country Code": "int16",
+    "City": "object",
+    "Address": "object",
+    "Locality": "object",
+    "Locality Verbose": "object",
+    "Longitude": "float64",
+    "Latitude": "float64",
+    "Cuisines": "object",
+    "Average Cost for two": "int64",
+    "Currency": "object",
+    "Has Table booking": "bool",
+    "Has Online delivery": "bool",
+    "Is delivering now": "bool",
+    "Price range": "int8",
+    "Aggregate rating": "float64",
+    "Rating color": "object",
+    "Rating text": "object",
+    "Votes": "int64",
+}
+
+# Textos de endereço: ficam no snapshot Parquet e no download dos dados tratados, mas nenhuma
+# página os usa, então o dataframe de load_data é lido do snapshot sem eles:
+ADDRESS_COLUMNS = ["Address", "Locality", "Locality_Verbose"]
+
+# Compressões descomprimidas pelo pyarrow, pela extensão do arquivo (.zip e .xz usam a
+# biblioteca padrão):
+ARROW_CODECS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd"}
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Renomeação das colunas do Dataframe:
+COLUMNS_RENAME = {
+    "Restaurant ID": "Restaurant_ID",
+    "Restaurant Name": "Restaurant_Name",
+    "Country Code": "Country_Name",
+    "Locality Verbose": "Locality_Verbose",
+    "Average Cost for two": "Average_Cost_for_two",
+    "Has Table booking": "Has_Table_booking",
+    "Has Online delivery": "Has_Online_delivery",
+    "Is delivering now": "Is_delivering_now",
+    "Price range": "Price_range",
+    "Aggregate rating": "Aggregate_rating",
+    "Rating color": "Rating_color",
+    "Rating text": "Rating_text",
+}
+
+# Colunas de baixa cardinalidade armazenadas como categóricas (ordenadas alfabeticamente):
+CATEGORICAL_COLUMNS = [
+    "Country_Name",
+    "City",
+    "Cuisines",
+    "All_Cuisines",
+    "Currency",
+    "Rating_color",
+    "Rating_text",
+    "Price_range",
+]
+
+# Culinárias com Média Negativa de Avaliação, retiradas do conjunto de dados:
+NEGATIVE_CUISINES = ["Mineira", "Drinks Only"]
+
+
+# Função de Busca das linhas duplicadas de um mesmo restaurante:
+def find_duplicates(df, cols, linhas_validas, keep="first"):
+    """Esta função encontra as linhas repetidas de um mesmo Restaurant ID.
+
+    Somente as linhas válidas participam, e fica uma linha por Restaurant ID: a primeira ou a
+    última, conforme keep. A busca usa só a coluna de IDs (inteiros), sem comparar os textos de
+    todas as colunas. A impressão digital da linha (hash de 64 bits das colunas cols,
+    pd.util.hash_pandas_object) é calculada apenas para as linhas de IDs repetidos, e separa as
+    cópias exatas (ID e impressão digital já vistos) das versões conflitantes do mesmo ID.
+
+    Input: Dataframe Sujo, colunas comparadas, máscara das linhas válidas e linha mantida
+           ('first' ou 'last').
+    Output: Máscara das linhas removidas e relatório com:
+            - linhas: quantidade de linhas removidas
+            - copias_exatas: linhas removidas iguais a uma linha já vista do mesmo ID
+            - versoes_conflitantes: linhas removidas com outro conteúdo para o mesmo ID
+            - ids_conflitantes: Restaurant IDs com mais de uma versão, em ordem crescente
+    """
+    posicoes = np.flatnonzero(linhas_validas.to_numpy())
+    ids = df["Restaurant ID"].to_numpy()[posicoes]
+    repetidas = posicoes[pd.Index(ids).duplicated(keep=False)]
+
+    pares = pd.DataFrame(
+        {
+            "id": df["Restaurant ID"].to_numpy()[repetidas],
+            "fingerprint": pd.util.hash_pandas_object(
+                df.iloc[repetidas][cols], index=False
+            ).to_numpy(),
+        }
+    )
+    removidas = pares["id"].duplicated(keep=keep).to_numpy()
+    copias_exatas = int(pares.duplicated(keep=keep).sum())
+    versoes = pares.drop_duplicates().groupby("id")["fingerprint"].size()
+
+    duplicadas = np.zeros(len(df), dtype=bool)
+    duplicadas[repetidas[removidas]] = True
+    relatorio = {
+        "linhas": int(removidas.sum()),
+        "copias_exatas": copias_exatas,
+        "versoes_conflitantes": int(removidas.sum()) - copias_exatas,
+        "ids_conflitantes": [int(i) for i in versoes.index[versoes.to_numpy() > 1]],
+    }
+
+    return duplicadas, relatorio
+
+
+# Função de Limpeza do Conjunto de Dados:
+def clean_code(df, keep="first"):
+    """Esta função tem a responsabilidade de limpar o dataframe
+
+    Tipos de Limpeza:
+    1. Remoção da coluna de valores vazios 'Swith to order menu'
+    2. Renomeia as colunas do Dataframe
+    3. Remoção de dados duplicados: uma linha por Restaurant ID (find_duplicates)
+    4. Remoção os valores NA que forem np.na
+    5. Categorização de todos os restaurantes  por somente um tipo de culinária
+    6. Retirada de registros com Média Negativa de Avaliação
+    7. Texto original com todas as culinárias mantido na coluna 'All_Cuisines'
+
+    As etapas 3, 4 e 6 são combinadas em uma única máscara, e o dataframe é copiado uma única
+    vez. A primeira culinária é calculada somente sobre os valores distintos da coluna
+    (pd.factorize), e não linha a linha. Sem a coluna 'All_Cuisines', e com as duplicatas do
+    mesmo Restaurant ID sendo cópias exatas (como no CSV), o resultado é idêntico ao da versão
+    com .apply(). A coluna 'All_Cuisines' é a base do índice de culinárias
+    (utils/cuisine_index.py), que considera todas as culinárias de cada restaurante.
+
+    A duplicata é escolhida entre as linhas que passam pelas etapas 4 e 6, e o relatório das
+    linhas removidas fica em df.attrs["duplicates"]. Os IDs com versões conflitantes são
+    registrados no log.
+
+    Input: Dataframe Sujo e linha mantida de cada Restaurant ID ('first' ou 'last').
+    Output: Dataframe Limpo
+    """
+
+    # 1. Retirar a coluna de valores vazios 'Swith to order menu' (quando ela foi lida):
+    cols = df.columns.drop("Switch to order menu", errors="ignore")
+
+    # 5. Categorizar todos os restaurantes somente por um tipo de culinária:
+    codes, uniques = pd.factorize(df["Cuisines"])
+    primeira_culinaria = uniques.astype(str).str.split(",").str[0].to_numpy()[codes]
+
+    # 4. Remove os NA que forem np.na (fora dos textos de endereço, que as páginas não usam) e
+    # 6. Retirar Registros com Média Negativa de Avaliação:
+    colunas_na = [col for col in cols if COLUMNS_RENAME.get(col, col) not in ADDRESS_COLUMNS]
+    linhas_validas = df[colunas_na].notna().all(axis=1)
+    linhas_validas &= ~pd.Series(primeira_culinaria, index=df.index).isin(NEGATIVE_CUISINES)
+
+    # 3. Remove Dados Duplicados (uma linha por Restaurant ID):
+    duplicadas, relatorio = find_duplicates(df, cols, linhas_validas, keep)
+    linhas_validas &= ~duplicadas
+    log_duplicates(relatorio)
+
+    # 2. Renomeando as colunas do Dataframe:
+    df_limpo = df.loc[linhas_validas, cols].rename(columns=COLUMNS_RENAME, copy=False)
+    # 7. Manter o texto com todas as culinárias:
+    df_limpo["All_Cuisines"] = df_limpo["Cuisines"]
+    df_limpo["Cuisines"] = primeira_culinaria[linhas_validas.to_numpy()]
+    df_limpo.attrs["duplicates"] = relatorio
+
+    return df_limpo
+
+
+def log_duplicates(relatorio):
+    """Esta função registra no log os Restaurant IDs com versões conflitantes.
+
+    Input: Relatório de duplicatas (find_duplicates).
+    Output: Nenhum.
+    """
+    if relatorio["ids_conflitantes"]:
+        logger.warning(
+            "Restaurant IDs com versões conflitantes (%s linhas removidas): %s",
+            relatorio["versoes_conflitantes"],
+            relatorio["ids_conflitantes"],
+        )
+
+
+# -----------------------------------------------------------------------------------------
+# Funções Fornecidas previamente
+# -----------------------------------------------------------------------------------------
+
+# Função para colocar o nome dos países com base no código de cada país:
+COUNTRIES = {
+    1: "India",
+    14: "Australia",
+    30: "Brazil",
+    37: "Canada",
+    94: "Indonesia",
+    148: "New Zeland",
+    162: "Philippines",
+    166: "Qatar",
+    184: "Singapure",
+    189: "South Africa",
+    191: "Sri Lanka",
+    208: "Turkey",
+    214: "United Arab Emirates",
+    215: "England",
+    216: "United States of America",
+}
+
+
+def country_name(Country_ID):
+    return COUNTRIES[Country_ID]
+
+
+# Função para criação do nome das Cores:
+COLORS = {
+    "3F7E00": "darkgreen",
+    "5BA829": "green",
+    "9ACD32": "lightgreen",
+    "CDD614": "orange",
+    "FFBA00": "red",
+    "CBCBC8": "darkred",
+    "FF7800": "darkred",
+}
+# Cor dos códigos que não existem em COLORS: o nome da cor vai para o marcador do mapa, que só
+# aceita as cores do Folium:
+UNKNOWN_COLOR = "gray"
+
+# Tipos de Categoria de Comida por faixa de preço (qualquer outra faixa é "gourmet"):
+PRICE_TYPES = {
+    1: "cheap",
+    2: "normal",
+    3: "expensive",
+}
+
+# Valor usado para os códigos que não existem nas tabelas acima:
+UNKNOWN = "Unknown"
+
+
+# Função para trocar códigos por nomes a partir de uma tabela:
+def map_codes(codes, table, default=UNKNOWN):
+    """Esta função troca os códigos de uma coluna pelos nomes de uma tabela (dicionário).
+
+    O Series.map com dicionário faz a busca de forma vetorizada. Códigos que não existem na
+    tabela recebem o valor 'default', em vez de gerar um KeyError que derrubaria a página.
+
+    Input: Coluna com os códigos, tabela de códigos para nomes e nome dos códigos desconhecidos.
+    Output: Coluna com os nomes e contagem de linhas por código desconhecido.
+    """
+    names = codes.map(table)
+    desconhecidos = names.isna()
+    contagem = {str(k): int(v) for k, v in codes[desconhecidos].value_counts().items()}
+
+    return names.fillna(default), contagem
+
+
+# Função para Criação do Tipo de Categoria de Comida
+def create_price_type(price_range):
+    """Esta função troca a faixa de preço pelo tipo de categoria de comida com np.select.
+
+    Input: Coluna com as faixas de preço.
+    Output: Coluna com os tipos de categoria de comida.
+    """
+    condicoes = [price_range == faixa for faixa in PRICE_TYPES]
+    tipos = np.select(condicoes, list(PRICE_TYPES.values()), default="gourmet")
+
+    return pd.Series(tipos, index=price_range.index, dtype=object)
+
+
+# Função de Enriquecimento do Conjunto de Dados:
+def enrich_data(df):
+    """Esta função troca os códigos do dataframe limpo pelos nomes usados nas páginas.
+
+    Etapas:
+    1 - Troca o código do país pelo nome do país (tabela COUNTRIES).
+    2 - Troca o código hexadecimal da cor da avaliação pelo nome da cor (tabela COLORS).
+    3 - Troca a faixa de preço pelo tipo de categoria de comida (tabela PRICE_TYPES).
+
+    Códigos desconhecidos de país viram UNKNOWN e de cor viram UNKNOWN_COLOR. A contagem de
+    linhas por código desconhecido fica em df.attrs["unknown_codes"] e é registrada no log.
+
+    Input: Dataframe Limpo
+    Output: Dataframe Enriquecido
+    """
+    df["Country_Name"], paises_desconhecidos = map_codes(df["Country_Name"], COUNTRIES)
+    df["Rating_color"], cores_desconhecidas = map_codes(df["Rating_color"], COLORS, UNKNOWN_COLOR)
+    df["Price_range"] = create_price_type(df["Price_range"])
+
+    df.attrs["unknown_codes"] = {
+        "Country_Name": paises_desconhecidos,
+        "Rating_color": cores_desconhecidas,
+    }
+    for col, contagem in df.attrs["unknown_codes"].items():
+        if contagem:
+            logger.warning("Códigos desconhecidos em %s: %s", col, contagem)
+
+    return df
+
+
+# Função de Conversão das colunas de baixa cardinalidade para categóricas:
+def to_categoricals(df):
+    """Esta função converte as colunas de CATEGORICAL_COLUMNS para o tipo category.
+
+    Cada valor passa a ser guardado como um código inteiro e os textos ficam uma única vez no
+    dicionário de categorias, o que reduz a memória e faz com que isin/groupby trabalhem sobre
+    os códigos. As categorias são ordenadas alfabeticamente (ordered=True), assim sort_values,
+    min e max mantêm o mesmo resultado que tinham com as colunas de texto.
+
+    Observação: com colunas categóricas, os groupby devem usar observed=True para não gerar
+    grupos vazios para as categorias que não aparecem no filtro.
+
+    Input: Dataframe Enriquecido
+    Output: Dataframe Enriquecido com colunas categóricas
+    """
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype("category").cat.as_ordered()
+
+    return df
+
+
+def decode_categoricals(df):
+    """Esta função converte as colunas categóricas de uma tabela já agregada de volta para texto.
+
+    O plotly express agrupa internamente as colunas usadas em 'color' sem observed=True, o que
+    falha com colunas categóricas. Como a tabela agregada é pequena, a conversão é barata.
+
+    Input: Tabela agregada com colunas categóricas.
+    Output: Tabela agregada com as colunas categóricas como texto.
+    """
+    cols = df.select_dtypes("category").columns
+    return df.astype({col: object for col in cols})
+
+
+# _____________________________________________________________________
+
+# Funções de Carregamento compartilhadas entre as páginas:
+
+
+@st.cache_data(show_spinner=False)
+def file_hash(path, mtime_ns, size):
+    """Esta função calcula o hash do conteúdo do arquivo de dados.
+
+    O resultado fica em cache pela combinação (caminho, mtime, tamanho), assim o arquivo
+    só é relido por completo quando ele é de fato alterado no disco.
+
+    Input: Caminho, data de modificação e tamanho do arquivo.
+    Output: Hash sha256 do conteúdo do arquivo.
+    """
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            sha.update(bloco)
+
+    return sha.hexdigest()
+
+
+def delta_dir(path=DATASET_PATH):
+    """Esta função retorna o diretório dos lotes de restaurantes (deltas) ingeridos sobre o CSV.
+
+    Input: Caminho do arquivo CSV (ex.: zomato.csv).
+    Output: Caminho do diretório de deltas (ex.: zomato.deltas).
+    """
+    return os.path.splitext(snapshot_path(path))[0] + ".deltas"
+
+
+def delta_paths(path=DATASET_PATH):
+    """Esta função lista os deltas já ingeridos sobre o CSV, na ordem de ingestão.
+
+    Input: Caminho do arquivo CSV.
+    Output: Lista com os caminhos dos arquivos de delta (vazia se não houver nenhum).
+    """
+    pasta = delta_dir(path)
+    if not os.path.isdir(pasta):
+        return []
+
+    return [
+        os.path.join(pasta, nome)
+        for nome in sorted(os.listdir(pasta))
+        if ".csv" in nome and not nome.endswith(".tmp")
+    ]
+
+
+def part_path(delta):
+    """Esta função retorna o caminho da parte Parquet de um delta ingerido (o delta já limpo).
+
+    Input: Caminho do delta (ex.: zomato.deltas/000002.csv.gz).
+    Output: Caminho da parte (ex.: zomato.deltas/000002.parquet).
+    """
+    pasta, nome = os.path.split(delta)
+    return os.path.join(pasta, nome.split(".")[0] + ".parquet")
+
+
+def chain_version(previous, delta):
+    """Esta função calcula a versão dos dados depois de um delta a partir da versão anterior.
+
+    Input: Versão anterior e caminho do delta.
+    Output: Hash sha256 da versão anterior com o hash do conteúdo do delta.
+    """
+    stat = os.stat(delta)
+    delta_hash = file_hash(delta, stat.st_mtime_ns, stat.st_size)
+
+    return hashlib.sha256(f"{previous}:{delta_hash}".encode()).hexdigest()
+
+
+def dataset_versions(path=DATASET_PATH):
+    """Esta função retorna a versão do CSV seguida da versão depois de cada delta ingerido.
+
+    A versão depois de um delta é o hash da versão anterior com o hash do conteúdo do delta
+    (chain_version), então cada versão identifica o CSV e todos os deltas aplicados até ela. Ela
+    fica gravada na parte Parquet do delta (part_path), junto com a versão anterior: quando a
+    versão anterior confere, a versão gravada é usada e o delta não é relido. Só os deltas sem
+    parte (ou com a parte de outra cadeia) têm o conteúdo lido e o hash calculado.
+
+    Input: Caminho do arquivo de dados.
+    Output: Lista de versões (hashes sha256), uma a mais que a quantidade de deltas.
+    """
+    stat = os.stat(path)
+    versions = [file_hash(path, stat.st_mtime_ns, stat.st_size)]
+    for delta in delta_paths(path):
+        metadata = snapshot_metadata(part_path(delta))
+        if metadata.get(PREVIOUS_HASH_KEY) == versions[-1].encode():
+            versions.append(metadata[SOURCE_HASH_KEY].decode())
+        else:
+            versions.append(chain_version(versions[-1], delta))
+
+    return versions
+
+
+def dataset_version(path=DATASET_PATH):
+    """Esta função retorna a versão (hash do conteúdo) do arquivo de dados atual.
+
+    Com deltas ingeridos (ingest_delta), a versão também muda a cada novo delta, e todos os
+    caches por versão (dados, cubo, índices e gráficos) passam a usar os dados atualizados. A
+    versão vem da parte Parquet do último delta, que guarda a versão do CSV de origem da cadeia
+    e a quantidade de deltas aplicados: sem percorrer os outros deltas, que não são alterados
+    depois da ingestão. Sem essa parte, a cadeia é refeita (dataset_versions).
+
+    Input: Caminho do arquivo de dados.
+    Output: Hash sha256 do conteúdo do arquivo e dos deltas ingeridos.
+    """
+    stat = os.stat(path)
+    base = file_hash(path, stat.st_mtime_ns, stat.st_size)
+    deltas = delta_paths(path)
+    if not deltas:
+        return base
+
+    metadata = snapshot_metadata(part_path(deltas[-1]))
+    cadeia = (metadata.get(BASE_HASH_KEY), metadata.get(DELTAS_KEY))
+    if cadeia == (base.encode(), str(len(deltas)).encode()):
+        return metadata[SOURCE_HASH_KEY].decode()
+
+    return dataset_versions(path)[-1]
+
+
+# Função de Leitura do arquivo de origem (CSV, comprimido ou não):
+def open_source(path):
+    """Esta função abre um arquivo de origem CSV para leitura, comprimido ou não.
+
+    A compressão vem da extensão do arquivo: .zip (com um único CSV), .gz, .bz2, .xz ou .zst.
+    O arquivo é descomprimido em streaming durante a leitura, sem extrair o CSV para o disco.
+
+    Input: Caminho do arquivo.
+    Output: Arquivo aberto em modo binário (usar com 'with').
+    """
+    extensao = os.path.splitext(path)[1]
+    if extensao == ".zip":
+        arquivo = zipfile.ZipFile(path)
+        nomes = [nome for nome in arquivo.namelist() if not nome.endswith("/")]
+        if len(nomes) != 1:
+            arquivo.close()
+            raise ValueError(f"O arquivo {path} deve conter um único CSV, e contém {nomes}")
+        return arquivo.open(nomes[0])
+    if extensao == ".xz":
+        return lzma.open(path)
+
+    return pa.input_stream(path, compression=ARROW_CODECS.get(extensao))
+
+
+# Opções do parser CSV do pyarrow: só as colunas e os tipos de SOURCE_SCHEMA, e textos vazios
+# (ou "NA", "null", ...) como valores ausentes, como no pd.read_csv:
+def _convert_options():
+    return pa_csv.ConvertOptions(
+        include_columns=list(SOURCE_SCHEMA),
+        column_types={
+            col: pa.string() if dtype == "object" else pa.from_numpy_dtype(np.dtype(dtype))
+            for col, dtype in SOURCE_SCHEMA.items()
+        },
+        strings_can_be_null=True,
+    )
+
+
+# Função de Leitura do arquivo de origem (CSV, comprimido ou não):
+def read_source(path):
+    """Esta função lê as colunas de SOURCE_SCHEMA de um arquivo de origem CSV.
+
+    A leitura usa o parser CSV do pyarrow (multithread), que lê somente as colunas declaradas
+    e converte cada uma direto para o seu tipo, sem a inferência de tipos do pd.read_csv e sem
+    criar a coluna 'Switch to order menu', sempre vazia.
+
+    Input: Caminho do arquivo (comprimido ou não, ver open_source).
+    Output: Dataframe Sujo com as colunas de SOURCE_SCHEMA.
+    """
+    with open_source(path) as arquivo:
+        table = pa_csv.read_csv(arquivo, convert_options=_convert_options())
+
+    return table.to_pandas()
+
+
+def read_source_chunks(path, chunk_size):
+    """Esta função lê as colunas de SOURCE_SCHEMA de um arquivo de origem CSV em blocos.
+
+    O parser em streaming do pyarrow (pa_csv.open_csv) lê o arquivo em lotes de alguns MB, que
+    são agrupados em blocos de chunk_size linhas. O índice de cada bloco continua o do bloco
+    anterior, como no pd.read_csv com chunksize, e os blocos juntos são iguais a read_source.
+
+    Input: Caminho do arquivo e quantidade de linhas por bloco.
+    Output: Gerador de Dataframes Sujos com as colunas de SOURCE_SCHEMA.
+    """
+    inicio = 0
+
+    def bloco(table):
+        nonlocal inicio
+        df = table.to_pandas()
+        df.index = pd.RangeIndex(inicio, inicio + len(df))
+        inicio += len(df)
+        return df
+
+    with open_source(path) as arquivo:
+        reader = pa_csv.open_csv(arquivo, convert_options=_convert_options())
+
+        # Linhas lidas que ainda não completaram um bloco (concat_tables e slice não copiam):
+        resto = reader.schema.empty_table()
+        for lote in reader:
+            resto = pa.concat_tables([resto, pa.Table.from_batches([lote])])
+            while resto.num_rows >= chunk_size:
+                yield bloco(resto.slice(0, chunk_size))
+                resto = resto.slice(chunk_size)
+
+        if resto.num_rows:
+            yield bloco(resto)
+
+
+def source_columns(path):
+    """Esta função retorna os nomes das colunas de um arquivo de origem CSV (o cabeçalho).
+
+    Input: Caminho do arquivo.
+    Output: Lista com os nomes das colunas.
+    """
+    with open_source(path) as arquivo:
+        return pa_csv.open_csv(arquivo).schema.names
+
+
+# Função de Preparação dos dados brutos (limpeza, enriquecimento e colunas categóricas):
+def prepare_data(df_raw, keep="first"):
+    """Esta função aplica a limpeza, o enriquecimento e a conversão para categóricas.
+
+    Input: Dataframe Sujo (o CSV completo ou um delta) e linha mantida de cada Restaurant ID.
+    Output: Dataframe Limpo e Enriquecido com colunas categóricas.
+    """
+    with stage("clean_code"):
+        df = clean_code(df_raw, keep)
+
+    return prepare_clean_data(df)
+
+
+def prepare_clean_data(df):
+    """Esta função aplica o enriquecimento e a conversão para categóricas ao dataframe limpo.
+
+    Input: Dataframe Limpo
+    Output: Dataframe Limpo e Enriquecido com colunas categóricas.
+    """
+    with stage("enrich_data"):
+        df = enrich_data(df)
+    with stage("to_categoricals"):
+        df = to_categoricals(df)
+
+    return df
+
+
+def merge_unknown_codes(*contagens):
+    """Esta função soma as contagens de códigos desconhecidos (df.attrs["unknown_codes"]).
+
+    Input: Contagens {coluna: {código: linhas}} de cada parte dos dados.
+    Output: Contagem total {coluna: {código: linhas}}.
+    """
+    total = {}
+    for contagem in contagens:
+        for col, codigos in contagem.items():
+            total.setdefault(col, {})
+            for codigo, linhas in codigos.items():
+                total[col][codigo] = total[col].get(codigo, 0) + linhas
+
+    return total
+
+
+def merge_duplicates(*relatorios):
+    """Esta função soma os relatórios de duplicatas (df.attrs["duplicates"]) de várias partes.
+
+    Input: Relatórios de duplicatas de cada parte dos dados.
+    Output: Relatório total, com a união dos IDs conflitantes.
+    """
+    total = {"linhas": 0, "copias_exatas": 0, "versoes_conflitantes": 0}
+    for relatorio in relatorios:
+        for chave in total:
+            total[chave] += relatorio[chave]
+    total["ids_conflitantes"] = sorted({i for r in relatorios for i in r["ids_conflitantes"]})
+
+    return total
+
+
+def csv_chunk_size():
+    """Esta função retorna o tamanho dos blocos da leitura em streaming do CSV.
+
+    Input: Nenhum.
+    Output: Quantidade de linhas por bloco (FOME_ZERO_CHUNK_SIZE), ou 0 para ler o CSV inteiro.
+    """
+    return int(os.environ.get(CHUNK_SIZE_ENV_VAR, "") or 0)
+
+
+# Função de Leitura do CSV em blocos (streaming):
+def find_seen(vistos, ids, fingerprints):
+    """Esta função procura os Restaurant IDs de um bloco nos IDs mantidos em blocos anteriores.
+
+    Os IDs do bloco são ordenados antes da busca: com as consultas em ordem, o np.searchsorted
+    percorre os arrays mantidos em sequência, com bem menos faltas de cache.
+
+    Input: Lista de pares (IDs ordenados, impressões digitais) mantidos (add_seen), IDs e
+           impressões digitais das linhas do bloco.
+    Output: Máscaras das linhas com ID já mantido e das que são cópias exatas da linha mantida.
+    """
+    ordem = np.argsort(ids)
+    ids_ordenados, fingerprints_ordenados = ids[ordem], fingerprints[ordem]
+
+    repetidas = np.zeros(len(ids), dtype=bool)
+    exatas = np.zeros(len(ids), dtype=bool)
+    for vistos_ids, vistos_fingerprints in vistos:
+        posicoes = np.searchsorted(vistos_ids, ids_ordenados)
+        posicoes = np.minimum(posicoes, len(vistos_ids) - 1)
+        encontradas = vistos_ids[posicoes] == ids_ordenados
+        iguais = encontradas & (vistos_fingerprints[posicoes] == fingerprints_ordenados)
+        # As máscaras ficam na ordem das linhas do bloco:
+        repetidas[ordem[encontradas]] = True
+        exatas[ordem[iguais]] = True
+
+    return repetidas, exatas
+
+
+def add_seen(vistos, ids, fingerprints):
+    """Esta função inclui os Restaurant IDs mantidos de um bloco na lista de IDs mantidos.
+
+    Os IDs ficam em arrays ordenados (runs). O bloco entra como um novo run, e o último run é
+    intercalado com o anterior enquanto o anterior não for maior que ele, como em um contador
+    binário: há no máximo log2(blocos) + 1 runs e cada ID é intercalado O(log(blocos)) vezes, em
+    vez de todos os IDs serem reordenados a cada bloco. A intercalação de dois arrays ordenados
+    usa a ordenação estável (timsort), que aproveita os dois trechos já ordenados.
+
+    Input: Lista de pares (IDs ordenados, impressões digitais), IDs e impressões digitais das
+           linhas mantidas do bloco (IDs únicos e ainda não mantidos).
+    Output: Nenhum (a lista é alterada).
+    """
+    ordem = np.argsort(ids, kind="stable")
+    vistos.append((ids[ordem], fingerprints[ordem]))
+
+    while len(vistos) > 1 and len(vistos[-2][0]) <= len(vistos[-1][0]):
+        (ids_a, fingerprints_a), (ids_b, fingerprints_b) = vistos[-2], vistos.pop()
+        ids_ab = np.concatenate([ids_a, ids_b])
+        ordem = np.argsort(ids_ab, kind="stable")
+        vistos[-1] = (ids_ab[ordem], np.concatenate([fingerprints_a, fingerprints_b])[ordem])
+
+
+def stream_csv(path, chunk_size, store_path):
+    """Esta função lê, limpa e enriquece o CSV bloco a bloco, sem carregar o CSV inteiro.
+
+    Etapas:
+    1 - Ler o CSV em blocos de chunk_size linhas (read_source_chunks).
+    2 - Limpar cada bloco (clean_code), que já remove as duplicatas dentro do bloco.
+    3 - Remover os Restaurant IDs mantidos em blocos anteriores: os IDs mantidos e a impressão
+        digital das suas linhas (pd.util.hash_pandas_object) ficam em poucos arrays ordenados
+        pelo ID (add_seen), consultados com np.searchsorted (find_seen).
+    4 - Enriquecer e converter as colunas para categóricas (prepare_clean_data) em cada bloco.
+    5 - Gravar os blocos no arquivo Parquet store_path (write_chunks), um por vez.
+    6 - Ler o arquivo Parquet, já com as colunas categóricas, e ordenar as categorias.
+
+    A memória usada depende do tamanho do bloco, mais 16 bytes por linha para os IDs e as
+    impressões digitais e o dataframe final (categórico, bem menor que o CSV lido como texto).
+    O resultado é igual ao de prepare_data(read_source(path)). No relatório de duplicatas, uma
+    linha de outro bloco é comparada só com a versão mantida do seu ID, então a divisão entre
+    cópias exatas e versões conflitantes pode mudar quando um ID tem mais de duas versões.
+
+    Input: Caminho do CSV, quantidade de linhas por bloco e caminho do arquivo Parquet temporário.
+    Output: Dataframe Limpo e Enriquecido com colunas categóricas.
+    """
+    vistos = []
+    unknown_codes = []
+    duplicates = []
+
+    def blocos():
+        for chunk in read_source_chunks(path, chunk_size):
+            with stage("clean_code"):
+                df = clean_code(chunk)
+            ids = df["Restaurant_ID"].to_numpy()
+            fingerprints = pd.util.hash_pandas_object(chunk.loc[df.index], index=False).to_numpy()
+
+            repetidas, exatas = find_seen(vistos, ids, fingerprints)
+            relatorio = {
+                "linhas": int(repetidas.sum()),
+                "copias_exatas": int(exatas.sum()),
+                "versoes_conflitantes": int((repetidas & ~exatas).sum()),
+                "ids_conflitantes": [int(i) for i in np.unique(ids[repetidas & ~exatas])],
+            }
+            log_duplicates(relatorio)
+            duplicates.extend([df.attrs["duplicates"], relatorio])
+
+            add_seen(vistos, ids[~repetidas], fingerprints[~repetidas])
+
+            if repetidas.any():
+                df = df.loc[~repetidas, :].copy()
+            df = prepare_clean_data(df)
+            unknown_codes.append(df.attrs["unknown_codes"])
+            yield df
+
+    try:
+        with stage("write_chunks"):
+            write_chunks(blocos(), store_path)
+        with stage("read_chunks"):
+            df = pd.read_parquet(store_path, memory_map=True)
+    finally:
+        if os.path.exists(store_path):
+            os.remove(store_path)
+
+    for col in CATEGORICAL_COLUMNS:
+        categorias = df[col].cat.categories
+        if not categorias.is_monotonic_increasing:
+            df[col] = df[col].cat.reorder_categories(categorias.sort_values())
+        df[col] = df[col].cat.as_ordered()
+
+    df.attrs = {
+        "unknown_codes": merge_unknown_codes(*unknown_codes),
+        "duplicates": merge_duplicates(*duplicates),
+    }
+
+    return df
+
+
+# Função de Combinação de uma coluna categórica de várias partes:
+def combine_categorical(colunas, linhas):
+    """Esta função junta uma coluna categórica de várias partes e seleciona as linhas indicadas.
+
+    As categorias do resultado são a união das categorias das partes, em ordem alfabética. Só
+    os códigos das partes com outras categorias são convertidos, por uma tabela de conversão do
+    tamanho das categorias, sem reconverter os textos: sem categorias novas nos deltas, os
+    códigos do dataframe existente são usados como estão. As categorias que nenhuma linha
+    selecionada usa são removidas (contagem com np.bincount, sem a ordenação do
+    remove_unused_categories).
+
+    Input: Colunas categóricas (uma por parte) e posições das linhas selecionadas nas partes em
+           sequência.
+    Output: Coluna categórica (pd.Categorical, ordered=True) com as linhas selecionadas.
+    """
+    categorias = colunas[0].cat.categories
+    for coluna in colunas[1:]:
+        if not coluna.cat.categories.isin(categorias).all():
+            categorias = categorias.union(coluna.cat.categories)
+
+    codigos = []
+    for coluna in colunas:
+        codes = coluna.cat.codes.to_numpy()
+        if not coluna.cat.categories.equals(categorias):
+            conversao = categorias.get_indexer(coluna.cat.categories)
+            codes = np.where(codes >= 0, conversao[codes], -1)
+        codigos.append(codes)
+    codigos = np.concatenate(codigos)[linhas]
+
+    usadas = np.bincount(codigos + 1, minlength=len(categorias) + 1)[1:] > 0
+    if not usadas.all():
+        conversao = np.cumsum(usadas) - 1
+        codigos = np.where(codigos >= 0, conversao[codigos], -1)
+        categorias = categorias[usadas]
+
+    return pd.Categorical.from_codes(codigos, categorias, ordered=True)
+
+
+def delta_report(delta, atualizados):
+    """Esta função monta o relatório de um delta aplicado (um item de df.attrs["deltas"]).
+
+    Input: Delta Limpo e Enriquecido (load_delta) e quantidade de restaurantes já existentes.
+    Output: Dicionário com as linhas do delta, os restaurantes novos, os atualizados, as linhas
+            duplicadas e as descartadas pela limpeza (duplicadas incluídas).
+    """
+    return {
+        "linhas": delta.attrs["linhas"],
+        "novos": len(delta) - atualizados,
+        "atualizados": atualizados,
+        "duplicados": delta.attrs["duplicates"]["linhas"],
+        "descartados": delta.attrs["linhas"] - len(delta),
+    }
+
+
+# Função de Atualização (upsert) do dataframe limpo com os deltas:
+def apply_deltas(df, deltas):
+    """Esta função insere os restaurantes novos dos deltas e atualiza os já existentes.
+
+    Os deltas já estão limpos e enriquecidos (load_delta), com uma linha por Restaurant_ID em
+    cada um, e são aplicados todos de uma vez. Os Restaurant_IDs do dataframe e dos deltas, em
+    sequência, são numerados na ordem da primeira ocorrência (pd.factorize, uma única tabela
+    hash): cada restaurante fica na posição da sua primeira ocorrência, com os valores da
+    última, o mesmo resultado da aplicação dos deltas um a um. Os restaurantes atualizados
+    mantêm o rótulo do índice, e os novos recebem rótulos seguidos depois do maior. As colunas
+    categóricas são juntadas por combine_categorical.
+
+    Input: Dataframe Limpo e Enriquecido e lista de deltas limpos, na ordem de ingestão.
+    Output: Dataframe Limpo e Enriquecido atualizado. O relatório de cada delta (delta_report)
+            fica em df.attrs["deltas"], e as duplicatas e os códigos desconhecidos dos deltas
+            entram também em df.attrs["duplicates"] e df.attrs["unknown_codes"].
+    """
+    partes = [df, *deltas]
+    inicios = np.cumsum([0] + [len(parte) for parte in partes])
+    codigos, ids = pd.factorize(
+        np.concatenate([parte["Restaurant_ID"].to_numpy() for parte in partes])
+    )
+
+    # Posição da última ocorrência de cada Restaurant_ID: cada delta sobrescreve os anteriores.
+    # Como os códigos seguem a ordem da primeira ocorrência, os códigos menores que a quantidade
+    # de Restaurant_IDs vistos antes do delta são dos restaurantes atualizados:
+    linhas = np.arange(len(ids))
+    vistos = len(df)
+    relatorios = []
+    for inicio, fim, delta in zip(inicios[1:-1], inicios[2:], deltas):
+        trecho = codigos[inicio:fim]
+        linhas[trecho] = np.arange(inicio, fim)
+        relatorios.append(delta_report(delta, int((trecho < vistos).sum())))
+        vistos = max(vistos, int(trecho.max()) + 1 if len(trecho) else 0)
+
+    colunas = {}
+    for col in df.columns:
+        if col in CATEGORICAL_COLUMNS:
+            colunas[col] = combine_categorical([parte[col] for parte in partes], linhas)
+        else:
+            colunas[col] = np.concatenate([parte[col].to_numpy() for parte in partes])[linhas]
+
+    rotulo = int(df.index.max()) + 1 if len(df) else 0
+    indice = np.concatenate([df.index.to_numpy(), np.arange(rotulo, rotulo + len(ids) - len(df))])
+    df_novo = pd.DataFrame(colunas, index=indice)
+
+    df_novo.attrs = {
+        "unknown_codes": merge_unknown_codes(*(parte.attrs["unknown_codes"] for parte in partes)),
+        "duplicates": merge_duplicates(*(parte.attrs["duplicates"] for parte in partes)),
+        "deltas": df.attrs.get("deltas", []) + relatorios,
+    }
+
+    return df_novo
+
+
+# Função de Leitura do CSV de origem já limpo (sem os deltas):
+def load_base(path, base_version, exclude=ADDRESS_COLUMNS):
+    """Esta função lê o dataframe limpo do CSV de origem do snapshot Parquet, ou o reconstrói.
+
+    O snapshot guarda todas as colunas e só depende do CSV e de SCHEMA_VERSION: ele não é
+    regravado na ingestão de um delta. Sem um snapshot válido, o CSV é lido inteiro ou em
+    blocos (FOME_ZERO_CHUNK_SIZE, stream_csv), limpo e gravado como snapshot.
+
+    Input: Caminho do arquivo de dados, versão do CSV (dataset_versions) e colunas que não
+           devem ser lidas.
+    Output: Dataframe Limpo e Enriquecido do CSV de origem.
+    """
+    parquet_path = snapshot_path(path)
+    with stage("read_snapshot"):
+        df = read_snapshot(parquet_path, base_version, SCHEMA_VERSION, exclude)
+    if df is not None:
+        return df
+
+    if csv_chunk_size():
+        with stage("stream_csv"):
+            df = stream_csv(path, csv_chunk_size(), f"{parquet_path}.{os.getpid()}.stream.tmp")
+    else:
+        with stage("read_csv"):
+            df_raw = read_source(path)
+        df = prepare_data(df_raw)
+
+    with stage("write_snapshot"):
+        write_snapshot(df, parquet_path, base_version, SCHEMA_VERSION)
+
+    return df.drop(columns=list(exclude))
+
+
+# Função de Leitura de um delta ingerido, já limpo:
+def load_delta(delta, versions, exclude=ADDRESS_COLUMNS):
+    """Esta função lê a parte Parquet de um delta ingerido, ou a cria a partir do delta.
+
+    A parte guarda as linhas do delta já limpas e enriquecidas (prepare_data com a última linha
+    válida de cada Restaurant_ID) e, nos metadados, a versão dos dados depois do delta, a
+    anterior, a do CSV de origem e a quantidade de deltas da cadeia (ver dataset_version). Ela
+    é gravada na ingestão e só é refeita a partir do delta quando falta ou é de outra
+    SCHEMA_VERSION.
+
+    Input: Caminho do delta, versões da cadeia até o delta (dataset_versions) e colunas que não
+           devem ser lidas.
+    Output: Delta Limpo e Enriquecido, com a quantidade de linhas lidas em df.attrs["linhas"].
+    """
+    parquet_path = part_path(delta)
+    with stage("read_snapshot"):
+        df = read_snapshot(parquet_path, versions[-1], SCHEMA_VERSION, exclude)
+    if df is not None:
+        return df
+
+    df_raw = read_source(delta)
+    df = prepare_data(df_raw, keep="last")
+    df.index = pd.RangeIndex(len(df))
+    df.attrs["linhas"] = len(df_raw)
+
+    cadeia = {
+        PREVIOUS_HASH_KEY: versions[-2],
+        BASE_HASH_KEY: versions[0],
+        DELTAS_KEY: str(len(versions) - 1),
+    }
+    with stage("write_snapshot"):
+        write_snapshot(df, parquet_path, versions[-1], SCHEMA_VERSION, cadeia)
+
+    return df.drop(columns=list(exclude))
+
+
+def load_version(path, version, exclude=ADDRESS_COLUMNS):
+    """Esta função carrega uma versão do conjunto de dados a partir dos arquivos Parquet.
+
+    O snapshot do CSV (load_base) e as partes dos deltas até a versão (load_delta) são lidos
+    com memory map, e os deltas são aplicados de uma vez (apply_deltas). Os arquivos que faltam
+    são gravados, e nenhum arquivo já gravado é reescrito.
+
+    Input: Caminho do arquivo de dados, versão (dataset_version) e colunas que não devem ser
+           lidas.
+    Output: Dataframe Limpo e Enriquecido da versão.
+    """
+    versions = dataset_versions(path)
+    # Com um delta ingerido depois da versão pedida, ele fica para a próxima versão:
+    if version in versions:
+        versions = versions[: versions.index(version) + 1]
+
+    df = load_base(path, versions[0], exclude)
+    deltas = [
+        load_delta(delta, versions[: k + 2], exclude)
+        for k, delta in enumerate(delta_paths(path)[: len(versions) - 1])
+    ]
+    if not deltas:
+        return df
+
+    with stage("apply_deltas"):
+        return apply_deltas(df, deltas)
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_data(path, version):
+    # A versão faz parte da chave do cache, um novo conteúdo gera um novo carregamento.
+    return load_version(path, version)
+
+
+@timed
+def load_data(path=DATASET_PATH):
+    """Esta função carrega, limpa e enriquece o conjunto de dados uma única vez por processo.
+
+    O dataframe resultante fica em cache (st.cache_resource) com a chave formada pelo caminho e
+    pela versão dos dados (dataset_version), e o mesmo objeto é entregue a todas as páginas e
+    sessões. Em um processo novo, ele é lido do snapshot Parquet ao lado do CSV e das partes dos
+    deltas ingeridos (load_version), sem os textos de endereço (ADDRESS_COLUMNS); os arquivos
+    que não correspondem ao CSV, aos deltas ou a SCHEMA_VERSION são reconstruídos. Ele deve ser
+    tratado como somente leitura: as páginas criam novos dataframes com .loc[] em vez de alterar
+    o dataframe compartilhado.
+
+    Input: Caminho do arquivo de dados.
+    Output: Dataframe Limpo e Enriquecido (compartilhado, somente leitura).
+    """
+    return _load_data(path, dataset_version(path))
+
+
+def snapshot_files(path=DATASET_PATH, versions=None):
+    """Esta função retorna os arquivos Parquet da versão atual dos dados, na ordem de aplicação.
+
+    São o snapshot do CSV e as partes dos deltas ingeridos. Os que faltam, ou são de outra
+    versão ou SCHEMA_VERSION, são gravados antes (load_version).
+
+    Input: Caminho do arquivo de dados e versões (dataset_versions), quando já calculadas.
+    Output: Lista com os caminhos do snapshot do CSV e das partes dos deltas.
+    """
+    versions = versions or dataset_versions(path)
+    arquivos = [snapshot_path(path)] + [part_path(delta) for delta in delta_paths(path)]
+    if [snapshot_source(arquivo, SCHEMA_VERSION) for arquivo in arquivos] != versions:
+        load_version(path, versions[-1])
+
+    return arquivos
+
+
+# Função de Leitura completa para o download dos dados tratados:
+def load_export_data(path=DATASET_PATH):
+    """Esta função carrega o dataframe limpo com todas as colunas dos arquivos Parquet.
+
+    O download dos dados tratados tem as mesmas linhas do dataframe de load_data e também os
+    textos de endereço (ADDRESS_COLUMNS), que o app não lê. As flags voltam a ser 0/1, como no
+    arquivo de origem. Os dados vêm do snapshot do CSV e das partes dos deltas (load_version),
+    sem reler o CSV; ele só é lido quando o snapshot não pode ser gravado (diretório sem
+    permissão de escrita), como em load_data. Não fica em cache: quem chama guarda o resultado
+    serializado (utils/export.py).
+
+    Input: Caminho do arquivo de dados.
+    Output: Dataframe Limpo e Enriquecido com todas as colunas do arquivo de origem.
+    """
+    df = load_version(path, dataset_version(path), exclude=())
+
+    return df.astype({col: "int64" for col in df.select_dtypes("bool").columns})
+
+
+# Função de Ingestão de um novo lote de restaurantes:
+def ingest_delta(delta_path, path=DATASET_PATH):
+    """Esta função ingere um lote de restaurantes novos ou atualizados (delta) sobre o CSV.
+
+    O delta deve ter as mesmas colunas do CSV e pode estar comprimido, como o arquivo de origem
+    (read_source). Ele é copiado para o diretório de deltas (o CSV original não é alterado), e
+    somente as suas linhas são limpas e gravadas como uma parte Parquet (load_delta), com a
+    nova versão encadeada a partir da versão gravada na parte anterior. O snapshot do CSV e as
+    partes anteriores não são regravados, e do catálogo só a coluna Restaurant_ID é lida, para
+    separar os restaurantes novos dos atualizados.
+
+    Os processos do app passam a usar os dados novos na próxima execução das páginas, pois todos
+    os caches são indexados pela versão. O cubo, os índices e a hierarquia espacial não são
+    atualizados de forma incremental: cada um é recriado a partir do dataframe da nova versão
+    quando uma página o usa, em uma única passada vetorizada (ver benchmarks/bench_pages.py). A
+    estrutura da versão anterior continua em cache, sem alteração, para as sessões que ainda a
+    usam (VERSION_CACHE_ENTRIES), o que uma atualização no lugar não permitiria.
+
+    Input: Caminho do delta (CSV) e caminho do arquivo de dados.
+    Output: Dicionário com as linhas do delta, os restaurantes novos, os atualizados, as linhas
+            duplicadas e as descartadas pela limpeza (duplicadas incluídas).
+    """
+    colunas = source_columns(path)
+    colunas_delta = source_columns(delta_path)
+    if set(colunas_delta) != set(colunas):
+        raise ValueError(
+            f"O delta {delta_path} não tem as colunas de {path}: "
+            f"faltando {sorted(set(colunas) - set(colunas_delta))}, "
+            f"sobrando {sorted(set(colunas_delta) - set(colunas))}"
+        )
+
+    # Restaurant_IDs da versão atual (os arquivos Parquet que faltam são gravados antes):
+    versions = dataset_versions(path)
+    arquivos = snapshot_files(path, versions)
+    ids = np.concatenate([read_column(arquivo, "Restaurant_ID") for arquivo in arquivos])
+
+    pasta = delta_dir(path)
+    os.makedirs(pasta, exist_ok=True)
+    # O delta é gravado como NNNNNN.csv, mantendo só a extensão de compressão do arquivo original
+    # (ex.: novos.txt.gz -> 000002.csv.gz), o nome que delta_paths lista e read_source lê:
+    compressao = os.path.splitext(delta_path)[1].lower()
+    extensao = ".csv" + (compressao if compressao in COMPRESSED_EXTENSIONS else "")
+    destino = os.path.join(pasta, f"{len(delta_paths(path)) + 1:06d}{extensao}")
+    tmp_path = f"{destino}.{os.getpid()}.tmp"
+    shutil.copyfile(delta_path, tmp_path)
+    os.replace(tmp_path, destino)
+
+    versions.append(chain_version(versions[-1], destino))
+    delta = load_delta(destino, versions)
+
+    # A versão atual deve incluir todos os deltas do diretório, inclusive o que acabou de entrar:
+    if dataset_version(path) != versions[-1]:
+        raise RuntimeError(f"A versão atual de {path} não inclui o delta {destino}")
+
+    return delta_report(delta, int(delta["Restaurant_ID"].isin(ids).sum()))
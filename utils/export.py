@@ -0,0 +1,71 @@
+# Importando as Bibliotecas:
+
+import gzip
+import io
+
+import streamlit as st
+
+from utils.data import DATASET_PATH, VERSION_CACHE_ENTRIES, dataset_version, load_export_data
+
+# Formatos disponíveis para o download dos dados tratados: (nome do arquivo, mime)
+EXPORT_FORMATS = {
+    "CSV": ("zomato_tratado.csv", "text/csv"),
+    "CSV (gzip)": ("zomato_tratado.csv.gz", "application/gzip"),
+    "Parquet": ("zomato_tratado.parquet", "application/vnd.apache.parquet"),
+}
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES * len(EXPORT_FORMATS))
+def _export_data(path, version, fmt):
+    # Leitura dos arquivos Parquet com todas as colunas, inclusive as que o app não usa:
+    df = load_export_data(path)
+
+    if fmt == "Parquet":
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+
+    csv = df.to_csv(index=False, sep=";").encode("utf-8")
+    if fmt == "CSV (gzip)":
+        return gzip.compress(csv, mtime=0)
+
+    return csv
+
+
+def export_data(fmt, path=DATASET_PATH):
+    """Esta função gera o arquivo para download com os dados tratados (limpos e enriquecidos).
+
+    O arquivo é serializado uma única vez por versão do conjunto de dados e formato, e os bytes
+    ficam em cache, assim uma interação na página não relê nem reserializa os dados. Ele tem
+    todas as colunas do arquivo de origem (load_export_data), inclusive os endereços.
+
+    Input: Formato do arquivo (uma das chaves de EXPORT_FORMATS).
+    Output: Conteúdo do arquivo em bytes.
+    """
+    return _export_data(path, dataset_version(path), fmt)
+
+
+# Função do Botão de Download dos Dados Tratados:
+def create_download_button():
+    """Esta função exibe na sidebar a escolha do formato e o botão de download dos dados tratados.
+
+    Input: Nenhum.
+    Output: Seção "Dados Analisados" exibida na sidebar.
+    """
+    st.sidebar.markdown("### Dados Analisados")
+    fmt = st.sidebar.selectbox("Formato do arquivo", list(EXPORT_FORMATS))
+    file_name, mime = EXPORT_FORMATS[fmt]
+
+    st.sidebar.download_button(
+        label="Download",
+        data=export_data(fmt),
+        file_name=file_name,
+        mime=mime,
+    )
+
+    return None
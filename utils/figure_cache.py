@@ -0,0 +1,64 @@
+# Cache dos gráficos das páginas, compartilhado entre sessões e execuções.
+
+# Importando as Bibliotecas:
+
+import functools
+import inspect
+
+import streamlit as st
+
+from utils.data import dataset_version
+
+# Quantidade máxima de gráficos em cache; acima dela os usados há mais tempo são descartados:
+FIGURE_CACHE_ENTRIES = 512
+
+# Funções de gráfico registradas com @cached_figure, por nome:
+_FIGURES = {}
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _figure(name, path, version, countries, options):
+    # A versão faz parte da chave do cache, um novo conteúdo gera novos gráficos.
+    return _FIGURES[name](list(countries), path=path, **dict(options))
+
+
+def cached_figure(func):
+    """Esta função (decorador) guarda em cache o gráfico criado pela função, serializado.
+
+    A chave é formada pelo nome da função, pela versão do conjunto de dados, pelos países
+    selecionados (sem ordem nem repetições) e pelos demais argumentos (top_n, top_asc, ...). Os
+    gráficos ficam em um único cache com no máximo FIGURE_CACHE_ENTRIES entradas, e os usados há
+    mais tempo são descartados primeiro. Com a seleção padrão de países, quase toda execução das
+    páginas reutiliza o gráfico de outra sessão em vez de refazer a agregação e a figura.
+
+    O st.cache_data guarda a figura serializada com pickle e entrega uma cópia nova a cada
+    chamada, então a página pode alterar a figura sem afetar o cache. O pickle mantém os arrays
+    numpy da figura; o caminho pelo JSON (to_json/from_json) passaria pela validação do Plotly,
+    que converte, por exemplo, os valores numéricos de 'text' em strings e muda os rótulos.
+
+    A função decorada deve receber 'countries_options' como primeiro argumento e 'path' como
+    argumento nomeado, e retornar uma figura do Plotly.
+
+    Input: Função de gráfico.
+    Output: Função com o mesmo nome e argumentos, que retorna a figura a partir do cache.
+    """
+    _FIGURES[func.__name__] = func
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        options = dict(arguments.arguments)
+
+        countries = tuple(sorted(set(options.pop("countries_options"))))
+        path = options.pop("path")
+
+        return _figure(func.__name__, path, dataset_version(path), countries, tuple(options.items()))
+
+    return wrapper
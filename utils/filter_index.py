@@ -0,0 +1,95 @@
+# Importando as Bibliotecas:
+
+import numpy as np
+import streamlit as st
+
+from utils.data import DATASET_PATH, VERSION_CACHE_ENTRIES, dataset_version, load_data
+from utils.perf import stage, timed
+
+# Colunas usadas nos filtros da sidebar que recebem um índice de linhas (o filtro de culinárias
+# usa todas as culinárias de cada restaurante, pelo índice CSR de utils/cuisine_index.py):
+INDEXED_COLUMNS = ["Country_Name"]
+
+# Quantidade de seleções de filtro com as posições das linhas em cache:
+SELECTION_CACHE_ENTRIES = 8
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Função de Criação do Índice de Linhas de uma coluna categórica:
+def build_column_index(col):
+    """Esta função cria, para cada categoria da coluna, o array com as posições das suas linhas.
+
+    As posições são obtidas com uma única ordenação estável dos códigos da coluna categórica,
+    então cada array já vem em ordem crescente de posição.
+
+    Input: Coluna categórica do Dataframe Limpo.
+    Output: Dicionário {categoria: array com as posições das linhas}.
+    """
+    codes = col.cat.codes.to_numpy()
+    ordem = np.argsort(codes, kind="stable")
+    limites = np.searchsorted(codes[ordem], np.arange(len(col.cat.categories) + 1))
+
+    index = {}
+    for i, categoria in enumerate(col.cat.categories):
+        posicoes = ordem[limites[i] : limites[i + 1]]
+        posicoes.flags.writeable = False
+        index[categoria] = posicoes
+
+    return index
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_filter_index(path, version):
+    df = load_data(path)
+    return {
+        "rows": len(df),
+        "columns": {col: build_column_index(df[col]) for col in INDEXED_COLUMNS},
+    }
+
+
+@timed
+def load_filter_index(path=DATASET_PATH):
+    """Esta função retorna o índice de filtros, criado uma única vez por versão do conjunto de dados.
+
+    Input: Caminho do arquivo de dados.
+    Output: Dicionário com a quantidade de linhas do dataframe ("rows") e, em "columns", o índice
+            de cada coluna de INDEXED_COLUMNS (compartilhado, somente leitura).
+    """
+    return _load_filter_index(path, dataset_version(path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def _selected_rows(path, version, column, values):
+    filter_index = _load_filter_index(path, version)
+    index = filter_index["columns"][column]
+
+    # União das posições com uma máscara temporária (sem ordenar), guardando só as posições:
+    mask = np.zeros(filter_index["rows"], dtype=bool)
+    for value in values:
+        if value in index:
+            mask[index[value]] = True
+    dtype = np.int32 if filter_index["rows"] < 2**31 else np.int64
+    posicoes = np.flatnonzero(mask).astype(dtype)
+
+    posicoes.flags.writeable = False
+    return posicoes
+
+
+def selected_rows(column, values, path=DATASET_PATH):
+    """Esta função retorna as posições das linhas cujo valor de 'column' está em 'values'.
+
+    As posições são a união, em ordem crescente, dos arrays de posições pré-calculados de cada
+    valor selecionado, e ficam em cache pela seleção: todas as funções de uma página (e as outras
+    sessões com a mesma seleção) reutilizam o mesmo array, sem varrer a coluna inteira com isin a
+    cada gráfico. O cache guarda até SELECTION_CACHE_ENTRIES seleções, e cada uma ocupa 4 bytes
+    por linha selecionada, e não uma posição por linha do dataframe.
+
+    Input: Nome da coluna indexada (INDEXED_COLUMNS) e valores selecionados no filtro.
+    Output: Array (somente leitura) com as posições das linhas selecionadas, em ordem crescente.
+    """
+    with stage(f"selected_rows({column})"):
+        return _selected_rows(path, dataset_version(path), column, tuple(sorted(values)))
@@ -0,0 +1,33 @@
+# Ingestão de lotes de restaurantes novos ou atualizados (deltas) sobre o conjunto de dados.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m utils.ingest novos_restaurantes.csv
+#     python -m utils.ingest novos_restaurantes.csv --path zomato.csv
+
+# Importando as Bibliotecas:
+
+import argparse
+import time
+
+from utils.data import DATASET_PATH, ingest_delta
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestão de um delta de restaurantes")
+    parser.add_argument("delta", help="arquivo CSV com as mesmas colunas do conjunto de dados")
+    parser.add_argument("--path", default=DATASET_PATH)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    report = ingest_delta(args.delta, args.path)
+    tempo = time.perf_counter() - inicio
+
+    print(
+        f"{report['linhas']:,} linhas em {args.delta}: {report['novos']:,} restaurantes novos, "
+        f"{report['atualizados']:,} atualizados e {report['descartados']:,} descartados "
+        f"pela limpeza, dos quais {report['duplicados']:,} duplicados ({tempo:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# Medição do tempo de cada etapa da execução das páginas (painel de desempenho opcional).
+
+# Importando as Bibliotecas:
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+# O painel aparece com ?perf=1 na URL ou com a variável de ambiente FOME_ZERO_PERF=1. Nos dois
+# casos, as execuções com o painel ativo também enviam linhas de log em JSON para o stderr do
+# servidor; sem o painel, nenhuma linha é montada.
+PERF_ENV_VAR = "FOME_ZERO_PERF"
+PERF_QUERY_PARAM = "perf"
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+# Cada sessão executa as páginas na sua própria thread, então as medições da execução atual
+# ficam na thread e não se misturam entre sessões:
+_run = threading.local()
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def perf_enabled():
+    """Esta função indica se o painel de desempenho está ativo na execução atual.
+
+    Input: Nenhum.
+    Output: True com ?perf=1 na URL ou FOME_ZERO_PERF=1, False caso contrário.
+    """
+    if os.environ.get(PERF_ENV_VAR, "") not in ("", "0"):
+        return True
+
+    values = st.experimental_get_query_params().get(PERF_QUERY_PARAM, [])
+    return bool(values) and values[0] not in ("", "0", "false")
+
+
+def start_run(page):
+    """Esta função inicia as medições de uma nova execução da página.
+
+    Input: Nome da página.
+    Output: Nenhum.
+    """
+    _run.page = page
+    _run.log = perf_enabled() and logger.isEnabledFor(logging.INFO)
+    _run.stages = []
+    _run.depth = 0
+    _run.start = time.perf_counter()
+
+
+@contextmanager
+def stage(name):
+    """Esta função mede o tempo de um trecho de código e registra a etapa na execução atual.
+
+    As etapas podem ser aninhadas (por exemplo, read_csv dentro de load_data); cada etapa é
+    registrada com o seu nível e, com o painel ativo, também emitida como uma linha de log em
+    JSON.
+
+    Input: Nome da etapa.
+    Output: Gerenciador de contexto (with stage("..."):).
+    """
+    if not hasattr(_run, "stages"):
+        start_run(None)
+
+    depth = _run.depth
+    position = len(_run.stages)
+    _run.stages.append(None)
+    _run.depth += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - inicio) * 1000
+        _run.depth = depth
+        _run.stages[position] = (name, depth, ms)
+        if _run.log:
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "stage",
+                        "page": _run.page,
+                        "stage": name,
+                        "depth": depth,
+                        "ms": round(ms, 3),
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+
+def timed(func):
+    """Esta função (decorador) registra cada chamada da função como uma etapa com o nome dela.
+
+    Input: Função.
+    Output: Função com a medição de tempo.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with stage(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def render_panel():
+    """Esta função exibe na sidebar o tempo de cada etapa da execução atual, quando ativo.
+
+    Deve ser chamada no final da página, depois de todas as etapas.
+
+    Input: Nenhum.
+    Output: Nenhum.
+    """
+    if not perf_enabled() or not hasattr(_run, "stages"):
+        return None
+
+    total = (time.perf_counter() - _run.start) * 1000
+    stages = [s for s in _run.stages if s is not None]
+    if _run.log:
+        logger.info(
+            json.dumps(
+                {"event": "run", "page": _run.page, "stages": len(stages), "ms": round(total, 3)},
+                ensure_ascii=False,
+            )
+        )
+
+    table = pd.DataFrame(
+        {
+            "Etapa": ["· " * depth + name for name, depth, _ in stages],
+            "ms": [round(ms, 1) for _, _, ms in stages],
+        }
+    )
+
+    st.sidebar.markdown("## Desempenho")
+    st.sidebar.markdown(f"Execução atual: **{total:,.0f} ms** em {len(stages)} etapas")
+    st.sidebar.dataframe(table, hide_index=True, use_container_width=True)
+
+    return None
@@ -0,0 +1,130 @@
+# Importando as Bibliotecas:
+
+import heapq
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.cube import MIN_VOTES
+from utils.cuisine_index import load_cuisine_index, rows_by_cuisine, take_rows
+from utils.data import DATASET_PATH, VERSION_CACHE_ENTRIES, dataset_version, load_data
+from utils.filter_index import build_column_index
+from utils.perf import timed
+
+# Colunas dos filtros que recebem listas de posições no ranking:
+RANKED_COLUMNS = ["Country_Name", "Cuisines"]
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Função de Criação do Índice de Ranking:
+def build_ranking_index(df, cuisine_index):
+    """Esta função cria o índice de ranking dos restaurantes com pelo menos MIN_VOTES avaliações.
+
+    Os restaurantes são ordenados uma única vez por nota e votos (decrescentes; empates mantêm a
+    ordem das linhas), e a posição de cada um nessa ordem é o seu ranking. Para cada país e cada
+    culinária o índice guarda a lista crescente dos rankings dos seus restaurantes. As culinárias
+    vêm do índice de culinárias, então um restaurante "Italian, Pizza" está nas listas de Italian
+    e de Pizza.
+
+    Os valores de cada ranking ficam no formato CSR (offsets e códigos): as categorias do ranking
+    r são codes[offsets[r]:offsets[r + 1]]. No país há exatamente um valor por ranking.
+
+    Input: Dataframe Limpo e Enriquecido e índice de culinárias.
+    Output: Dicionário com:
+            - order: posição no dataframe do restaurante de cada ranking
+            - values: para cada coluna de RANKED_COLUMNS, as categorias (códigos -> nomes)
+            - members: para cada coluna de RANKED_COLUMNS, os offsets e os códigos de cada ranking
+            - names: código do nome do restaurante de cada ranking
+            - lists: para cada coluna de RANKED_COLUMNS, {categoria: rankings em ordem crescente}
+    """
+    votes = df["Votes"].to_numpy()
+    rating = df["Aggregate_rating"].to_numpy()
+
+    eligible = np.flatnonzero(votes >= MIN_VOTES)
+    order = eligible[np.lexsort((-votes[eligible], -rating[eligible]))]
+    countries = df["Country_Name"].take(order)
+    cuisines = take_rows(cuisine_index, order)
+
+    index = {
+        "order": order,
+        "values": {
+            "Country_Name": countries.cat.categories,
+            "Cuisines": cuisine_index["cuisines"],
+        },
+        "members": {
+            "Country_Name": (np.arange(len(order) + 1), countries.cat.codes.to_numpy()),
+            "Cuisines": (cuisines["offsets"], cuisines["codes"]),
+        },
+        "names": pd.factorize(df["Restaurant_Name"].take(order))[0],
+        "lists": {
+            "Country_Name": build_column_index(countries),
+            "Cuisines": rows_by_cuisine(cuisines),
+        },
+    }
+
+    for array in [order, index["names"], *(a for m in index["members"].values() for a in m)]:
+        array.flags.writeable = False
+
+    return index
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_ranking_index(path, version):
+    return build_ranking_index(load_data(path), load_cuisine_index(path))
+
+
+@timed
+def load_ranking_index(path=DATASET_PATH):
+    """Esta função retorna o índice de ranking, criado uma única vez por versão do conjunto de dados.
+
+    Input: Caminho do arquivo de dados.
+    Output: Índice de ranking (compartilhado, somente leitura).
+    """
+    return _load_ranking_index(path, dataset_version(path))
+
+
+def top_ranked(countries_options, cuisines_options, top_n, path=DATASET_PATH):
+    """Esta função retorna as linhas dos top_n restaurantes melhor ranqueados da seleção.
+
+    As listas de ranking de um dos filtros (o que tiver menos restaurantes selecionados) são
+    percorridas em conjunto, em ordem crescente de ranking (heapq.merge), e cada restaurante é
+    testado no outro filtro pelos códigos das suas categorias (basta uma culinária selecionada).
+    Restaurantes de mesmo nome (redes) aparecem uma única vez, com a unidade melhor ranqueada.
+    A busca para após top_n acertos, então o custo depende de top_n e não da quantidade de
+    restaurantes.
+
+    Input: Países e culinárias selecionados no filtro e quantidade de restaurantes.
+    Output: Array com as posições das linhas no dataframe, do melhor para o pior ranking.
+    """
+    index = load_ranking_index(path)
+    selection = {"Country_Name": countries_options, "Cuisines": cuisines_options}
+
+    lists = {
+        col: [index["lists"][col][v] for v in values if v in index["lists"][col]]
+        for col, values in selection.items()
+    }
+    walk = min(RANKED_COLUMNS, key=lambda col: sum(len(ranks) for ranks in lists[col]))
+    other = RANKED_COLUMNS[1] if walk == RANKED_COLUMNS[0] else RANKED_COLUMNS[0]
+
+    categories = index["values"][other]
+    selected_codes = categories.get_indexer(list(selection[other]))
+    allowed = np.zeros(len(categories), dtype=bool)
+    allowed[selected_codes[selected_codes >= 0]] = True
+    offsets, codes = index["members"][other]
+    names = index["names"]
+
+    hits = []
+    seen = set()
+    for rank in heapq.merge(*lists[walk]):
+        if len(hits) >= top_n:
+            break
+        if names[rank] not in seen and allowed[codes[offsets[rank] : offsets[rank + 1]]].any():
+            seen.add(names[rank])
+            hits.append(rank)
+
+    return index["order"][np.array(hits, dtype=np.int64)]
@@ -0,0 +1,242 @@
+# Importando as Bibliotecas:
+
+import folium
+import streamlit as st
+import streamlit.components.v1 as components
+from branca.element import MacroElement
+from folium.elements import JSCSSMixin
+from folium.plugins import MarkerCluster
+from jinja2 import Template
+
+from utils.data import DATASET_PATH, dataset_version, load_data
+from utils.filter_index import selected_rows
+from utils.perf import timed
+from utils.spatial import DEEPEST_LEVEL, load_spatial_hierarchy, select_cells
+
+# Tamanho do mapa exibido na página:
+MAP_WIDTH = 1024
+MAP_HEIGHT = 768
+
+# Zoom a partir do qual os restaurantes são exibidos individualmente:
+DETAIL_ZOOM = DEEPEST_LEVEL + 1
+
+# Máximo de restaurantes enviados individualmente ao navegador. Acima disso, o zoom profundo
+# continua exibindo as bolhas do nível mais profundo da grade:
+MAX_DETAIL_RESTAURANTS = 20000
+
+# Cor das bolhas pela nota média (nota mínima, cor), da maior para a menor:
+RATING_COLORS = [
+    [4.5, "#3F7E00"],
+    [4.0, "#5BA829"],
+    [3.5, "#9ACD32"],
+    [3.0, "#CDD614"],
+    [2.5, "#FFBA00"],
+    [0.0, "#FF7800"],
+]
+# Cor das bolhas sem restaurantes avaliados:
+NOT_RATED_COLOR = "#9E9E9E"
+
+# Função JavaScript que cria, no navegador, o marcador de cada linha [lat, lon, cor, popup]:
+MARKER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({icon: "home", prefix: "fa", markerColor: row[2]});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    var popup = '<div style="width: 100.0%; height: 100.0%;">' + row[3] + "</div>";
+    marker.bindPopup(popup, {maxWidth: 500});
+    return marker;
+};
+"""
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+# Camada do mapa com as bolhas pré-agregadas por nível de zoom:
+class ClusterHierarchy(JSCSSMixin, MacroElement):
+    """Camada do Folium que exibe, em cada nível de zoom, as bolhas pré-agregadas daquele nível.
+
+    Cada bolha mostra a quantidade de restaurantes e a nota média dos restaurantes avaliados da
+    célula (cinza, sem nota, quando nenhum foi avaliado), e ao ser clicada aproxima o mapa.
+    A partir de DETAIL_ZOOM, se os restaurantes foram enviados (detail), eles
+    são exibidos individualmente, agrupados pelo Leaflet.markercluster.
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function () {
+            var map = {{ this._parent.get_name() }};
+            var levels = {{ this.levels|tojson }};
+            var detail = {{ this.detail|tojson }};
+            var ratingColors = {{ this.rating_colors|tojson }};
+            var notRatedColor = {{ this.not_rated_color|tojson }};
+            var detailZoom = {{ this.detail_zoom }};
+            var callback = {{ this.callback }}
+
+            function ratingColor(rating) {
+                if (rating === null) { return notRatedColor; }
+                for (var i = 0; i < ratingColors.length; i++) {
+                    if (rating >= ratingColors[i][0]) { return ratingColors[i][1]; }
+                }
+                return ratingColors[ratingColors.length - 1][1];
+            }
+
+            var layers = levels.map(function (cells, level) {
+                var group = L.layerGroup();
+                cells.forEach(function (cell) {
+                    var bubble = L.circleMarker([cell[0], cell[1]], {
+                        radius: 8 + 4 * Math.log10(cell[2]),
+                        color: ratingColor(cell[3]),
+                        fillOpacity: 0.6,
+                        weight: 1
+                    });
+                    var rating = cell[3] === null ? "Not rated" : cell[3].toFixed(2) + "/5.0";
+                    bubble.bindTooltip(
+                        cell[2] + " restaurantes<br />Aggragate Rating (avaliados): " + rating
+                    );
+                    bubble.on("click", function () {
+                        map.setView([cell[0], cell[1]], Math.min(level + 2, detailZoom));
+                    });
+                    group.addLayer(bubble);
+                });
+                return group;
+            });
+
+            var detailLayer = null;
+            if (detail !== null) {
+                detailLayer = L.markerClusterGroup();
+                detail.forEach(function (row) { detailLayer.addLayer(callback(row)); });
+            }
+
+            var current = null;
+            function update() {
+                var zoom = map.getZoom();
+                var next;
+                if (detailLayer !== null && zoom >= detailZoom) {
+                    next = detailLayer;
+                } else {
+                    next = layers[Math.max(0, Math.min(zoom, layers.length - 1))];
+                }
+                if (next === current) { return; }
+                if (current !== null) { map.removeLayer(current); }
+                map.addLayer(next);
+                current = next;
+            }
+
+            map.on("zoomend", update);
+            map.whenReady(update);
+        })();
+        {% endmacro %}
+        """
+    )
+
+    default_js = MarkerCluster.default_js
+    default_css = MarkerCluster.default_css
+
+    def __init__(self, levels, detail=None):
+        super().__init__()
+        self._name = "ClusterHierarchy"
+        self.levels = levels
+        self.detail = detail
+        self.rating_colors = RATING_COLORS
+        self.not_rated_color = NOT_RATED_COLOR
+        self.detail_zoom = DETAIL_ZOOM
+        self.callback = MARKER_CALLBACK.strip()
+
+
+# Função de Criação dos pop-ups dos restaurantes:
+def create_popups(df):
+    """Esta função monta o HTML do pop-up de todos os restaurantes de uma só vez.
+
+    Os pop-ups exibem nome, preço para dois, tipo de culinária e classificação do restaurante,
+    e são formados com concatenação vetorizada de colunas, sem percorrer o DataFrame linha a linha.
+
+    Input: Dados dos Restaurantes.
+    Output: Coluna com o HTML do pop-up de cada restaurante.
+    """
+    popups = (
+        "<p><strong>"
+        + df["Restaurant_Name"].astype(str)
+        + "</strong></p><p>Price: "
+        + df["Average_Cost_for_two"].astype(str)
+        + ",00 ("
+        + df["Currency"].astype(str)
+        + ") para dois<br />Type: "
+        + df["Cuisines"].astype(str)
+        + "<br />Aggragate Rating: "
+        + df["Aggregate_rating"].astype(str)
+        + "/5.0"
+    )
+
+    return popups
+
+
+# Função build_map:
+def build_map(levels, df=None):
+    """Esta função cria o mapa da localização dos restaurantes cadastrados na plataforma.
+
+    Em cada nível de zoom o mapa exibe as bolhas pré-agregadas daquele nível da hierarquia
+    espacial (quantidade de restaurantes e nota média por célula). Os restaurantes só são
+    enviados individualmente (em um único lote, com os pop-ups já montados) quando 'df' é
+    informado, e aparecem somente no zoom profundo.
+
+    Input: Bolhas por nível (select_cells) e, opcionalmente, Dados de Localização dos Restaurantes.
+    Output: Mapa feito no Folium destacando as localizações dos restaurantes.
+    """
+    m = folium.Map(max_bounds=True)
+
+    detail = None
+    if df is not None:
+        detail = (
+            df[["Latitude", "Longitude"]]
+            .assign(color=df["Rating_color"].astype(str), popup=create_popups(df))
+            .to_numpy()
+            .tolist()
+        )
+    ClusterHierarchy(levels, detail).add_to(m)
+
+    return m
+
+
+# Função render_map:
+def render_map(countries, path=DATASET_PATH):
+    """Esta função monta e serializa o mapa dos restaurantes dos países selecionados, sem cache.
+
+    Input: Países selecionados e caminho do conjunto de dados.
+    Output: HTML do mapa.
+    """
+    levels = select_cells(load_spatial_hierarchy(path), countries)
+
+    linhas_selecionadas = selected_rows("Country_Name", countries, path)
+    df = None
+    if len(linhas_selecionadas) <= MAX_DETAIL_RESTAURANTS:
+        df = load_data(path).take(linhas_selecionadas)
+
+    return folium.Figure().add_child(build_map(levels, df)).render()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _render_map(path, version, countries):
+    return render_map(countries, path)
+
+
+# Função create_map:
+@timed
+def create_map(countries_options, path=DATASET_PATH):
+    """Esta função exibe o mapa dos restaurantes dos países selecionados.
+
+    O HTML do mapa fica em cache pela versão do conjunto de dados e pelo conjunto de países
+    selecionados, então ele só é montado e serializado na primeira vez em que uma seleção aparece.
+    O tamanho do HTML é limitado pela quantidade de células da hierarquia espacial e por
+    MAX_DETAIL_RESTAURANTS, e não pela quantidade de restaurantes.
+
+    Input: Países selecionados no filtro.
+    Output: Mapa exibido na página.
+    """
+    countries = tuple(sorted(set(countries_options)))
+    html = _render_map(path, dataset_version(path), countries)
+    components.html(html, width=MAP_WIDTH, height=MAP_HEIGHT + 10)
+
+    return None
@@ -0,0 +1,177 @@
+# Importando as Bibliotecas:
+
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Extensões de compressão do arquivo de origem (zomato.csv.zip -> snapshot zomato.parquet):
+COMPRESSED_EXTENSIONS = (".zip", ".gz", ".bz2", ".xz", ".zst")
+
+# Chaves gravadas nos metadados do arquivo Parquet:
+SOURCE_HASH_KEY = b"fome_zero.source_hash"
+SCHEMA_VERSION_KEY = b"fome_zero.schema_version"
+ATTRS_KEY = b"fome_zero.attrs"
+# Nas partes dos deltas ingeridos: versão dos dados antes do delta, versão do CSV de origem da
+# cadeia de versões e quantidade de deltas aplicados até a parte:
+PREVIOUS_HASH_KEY = b"fome_zero.previous_hash"
+BASE_HASH_KEY = b"fome_zero.base_hash"
+DELTAS_KEY = b"fome_zero.deltas"
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def snapshot_path(path):
+    """Esta função retorna o caminho do snapshot Parquet ao lado do arquivo CSV de origem.
+
+    Input: Caminho do arquivo CSV, comprimido ou não (ex.: zomato.csv ou dataset/zomato.csv.zip).
+    Output: Caminho do snapshot (ex.: zomato.parquet ou dataset/zomato.parquet).
+    """
+    base, extensao = os.path.splitext(path)
+    if extensao in COMPRESSED_EXTENSIONS:
+        base = os.path.splitext(base)[0]
+
+    return base + ".parquet"
+
+
+def read_snapshot(path, source_hash, schema_version, exclude=()):
+    """Esta função lê o snapshot Parquet do dataframe limpo, se ele ainda for válido.
+
+    O snapshot é considerado válido somente quando o hash do CSV de origem e a versão do
+    esquema de limpeza gravados nos metadados são iguais aos atuais. A leitura dos metadados
+    não carrega os dados, e a leitura dos dados usa memory map. As colunas de exclude não são
+    lidas (projeção do Parquet), e o índice do dataframe é mantido.
+
+    Input: Caminho do snapshot, hash do CSV de origem, versão do esquema de limpeza e colunas
+           que não devem ser lidas.
+    Output: Dataframe Limpo e Enriquecido, ou None se o snapshot não existir ou estiver desatualizado.
+    """
+    try:
+        schema = pq.read_schema(path)
+    except (OSError, pa.ArrowInvalid):
+        return None
+    metadata = schema.metadata or {}
+
+    if metadata.get(SOURCE_HASH_KEY) != source_hash.encode():
+        return None
+    if metadata.get(SCHEMA_VERSION_KEY) != str(schema_version).encode():
+        return None
+
+    colunas = None
+    if exclude:
+        # As colunas do índice são incluídas pelo pd.read_parquet (metadados do pandas):
+        indices = (schema.pandas_metadata or {}).get("index_columns", [])
+        colunas = [nome for nome in schema.names if nome not in exclude and nome not in indices]
+
+    df = pd.read_parquet(path, columns=colunas, memory_map=True)
+    df.attrs.update(json.loads(metadata.get(ATTRS_KEY, b"{}")))
+
+    return df
+
+
+def snapshot_metadata(path):
+    """Esta função lê os metadados gravados em um arquivo Parquet, sem ler os dados.
+
+    Input: Caminho do arquivo.
+    Output: Dicionário {chave: valor} em bytes, vazio se o arquivo não existir ou for inválido.
+    """
+    try:
+        return pq.read_metadata(path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return {}
+
+
+def snapshot_source(path, schema_version):
+    """Esta função retorna o hash da origem gravado no snapshot Parquet, sem ler os dados.
+
+    Input: Caminho do snapshot e versão do esquema de limpeza.
+    Output: Hash da origem, ou None se o snapshot não existir ou for de outro esquema.
+    """
+    metadata = snapshot_metadata(path)
+    if metadata.get(SCHEMA_VERSION_KEY) != str(schema_version).encode():
+        return None
+
+    return metadata.get(SOURCE_HASH_KEY, b"").decode() or None
+
+
+def read_column(path, column):
+    """Esta função lê uma única coluna de um arquivo Parquet (projeção), com memory map.
+
+    Input: Caminho do arquivo e nome da coluna.
+    Output: Array numpy com os valores da coluna.
+    """
+    return pq.ParquetFile(path, memory_map=True).read(columns=[column]).column(0).to_numpy()
+
+
+def write_chunks(chunks, path):
+    """Esta função grava uma sequência de dataframes em um único arquivo Parquet, bloco a bloco.
+
+    Cada dataframe vira um ou mais row groups, e só um bloco fica em memória por vez. As colunas
+    categóricas de cada bloco têm categorias próprias; os índices dos dicionários são gravados
+    sempre como int32, para que todos os blocos tenham o mesmo esquema do primeiro. Na leitura
+    (pd.read_parquet), as categorias dos blocos são unificadas.
+
+    Input: Iterável de dataframes com as mesmas colunas e caminho do arquivo.
+    Output: Quantidade de linhas gravadas.
+    """
+    writer = None
+    linhas = 0
+    try:
+        for df in chunks:
+            table = pa.Table.from_pandas(df)
+            if writer is None:
+                schema = pa.schema(
+                    [
+                        field.with_type(
+                            pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered)
+                        )
+                        if pa.types.is_dictionary(field.type)
+                        else field
+                        for field in table.schema
+                    ],
+                    metadata=table.schema.metadata,
+                )
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(table.cast(schema))
+            linhas += len(df)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return linhas
+
+
+def write_snapshot(df, path, source_hash, schema_version, extra_metadata=None):
+    """Esta função grava o dataframe limpo como snapshot Parquet.
+
+    O arquivo é gravado em um arquivo temporário e depois renomeado, assim outro processo nunca
+    lê um snapshot pela metade. Se o diretório não permitir escrita, o snapshot é ignorado.
+
+    Input: Dataframe Limpo e Enriquecido, caminho do snapshot, hash do CSV de origem, versão do
+           esquema e metadados adicionais {chave: texto}.
+    Output: True se o snapshot foi gravado, False caso contrário.
+    """
+    table = pa.Table.from_pandas(df)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SOURCE_HASH_KEY] = source_hash.encode()
+    metadata[SCHEMA_VERSION_KEY] = str(schema_version).encode()
+    metadata[ATTRS_KEY] = json.dumps(df.attrs).encode()
+    for chave, valor in (extra_metadata or {}).items():
+        metadata[chave] = valor.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+    return True
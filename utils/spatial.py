@@ -0,0 +1,128 @@
+# Importando as Bibliotecas:
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data import DATASET_PATH, VERSION_CACHE_ENTRIES, dataset_version, load_data
+from utils.perf import timed
+
+# Nível mais profundo da grade espacial. No nível z a célula tem 360 / 2 ** (z + 2) graus,
+# o que corresponde a cerca de 64 pixels no zoom z do mapa:
+DEEPEST_LEVEL = 11
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def cell_size(level):
+    """Esta função retorna o tamanho, em graus, da célula da grade no nível informado.
+
+    Input: Nível da grade (0 a DEEPEST_LEVEL).
+    Output: Tamanho da célula em graus.
+    """
+    return 360 / 2 ** (level + 2)
+
+
+# Função de Criação da Hierarquia Espacial:
+def build_spatial_hierarchy(df):
+    """Esta função cria a hierarquia espacial (quadtree) dos restaurantes, por país.
+
+    Etapas:
+    1 - Calcular a célula de cada restaurante na grade do nível mais profundo (DEEPEST_LEVEL).
+    2 - Agregar os restaurantes por país e célula: quantidade, somas de latitude e longitude e,
+        só dos restaurantes avaliados (Votes > 0), quantidade e soma das notas. Os "Not rated"
+        têm nota 0 e puxariam a média da bolha para baixo.
+    3 - Obter cada nível acima a partir do nível de baixo, dividindo as coordenadas da célula
+        por 2 (cada célula tem 4 filhas), sem voltar aos restaurantes.
+
+    Input: Dataframe Limpo e Enriquecido
+    Output: Tabela com as colunas Level, Country_Name, Cell_x, Cell_y, Restaurants, Rated,
+            Rating_sum, Latitude_sum e Longitude_sum.
+    """
+    avaliados = df["Votes"] > 0
+    size = cell_size(DEEPEST_LEVEL)
+    keys = ["Country_Name", "Cell_x", "Cell_y"]
+
+    nivel = (
+        pd.DataFrame(
+            {
+                "Country_Name": df["Country_Name"],
+                "Cell_x": np.floor((df["Longitude"] + 180) / size).astype("int64"),
+                "Cell_y": np.floor((df["Latitude"] + 90) / size).astype("int64"),
+                "Restaurants": 1,
+                "Rated": avaliados.astype("int64"),
+                "Rating_sum": df["Aggregate_rating"].where(avaliados, 0.0),
+                "Latitude_sum": df["Latitude"],
+                "Longitude_sum": df["Longitude"],
+            }
+        )
+        .groupby(keys, observed=True)
+        .sum()
+        .reset_index()
+    )
+
+    niveis = [nivel.assign(Level=DEEPEST_LEVEL)]
+    for level in range(DEEPEST_LEVEL - 1, -1, -1):
+        nivel = (
+            nivel.assign(Cell_x=nivel["Cell_x"] // 2, Cell_y=nivel["Cell_y"] // 2)
+            .groupby(keys, observed=True)
+            .sum()
+            .reset_index()
+        )
+        niveis.append(nivel.assign(Level=level))
+
+    return pd.concat(niveis, ignore_index=True)
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def _load_spatial_hierarchy(path, version):
+    return build_spatial_hierarchy(load_data(path))
+
+
+@timed
+def load_spatial_hierarchy(path=DATASET_PATH):
+    """Esta função retorna a hierarquia espacial, criada uma única vez por versão do conjunto de dados.
+
+    Input: Caminho do arquivo de dados.
+    Output: Hierarquia espacial (compartilhada, somente leitura).
+    """
+    return _load_spatial_hierarchy(path, dataset_version(path))
+
+
+def select_cells(hierarchy, countries_options):
+    """Esta função soma as células da hierarquia dos países selecionados e calcula as bolhas do mapa.
+
+    Input: Hierarquia espacial e lista de países selecionados.
+    Output: Lista com um item por nível; cada item é a lista de bolhas
+            [latitude média, longitude média, quantidade de restaurantes, nota média]. A nota
+            média é a dos restaurantes avaliados, ou None se nenhum restaurante da bolha foi
+            avaliado.
+    """
+    cells = (
+        hierarchy.loc[hierarchy["Country_Name"].isin(countries_options), :]
+        .groupby(["Level", "Cell_x", "Cell_y"])[
+            ["Restaurants", "Rated", "Rating_sum", "Latitude_sum", "Longitude_sum"]
+        ]
+        .sum()
+        .reset_index()
+    )
+
+    bolhas = pd.DataFrame(
+        {
+            "Level": cells["Level"],
+            "Latitude": cells["Latitude_sum"] / cells["Restaurants"],
+            "Longitude": cells["Longitude_sum"] / cells["Restaurants"],
+            "Restaurants": cells["Restaurants"],
+            "Rating": (cells["Rating_sum"] / cells["Rated"]).round(2).astype(object),
+        }
+    )
+    bolhas.loc[cells["Rated"] == 0, "Rating"] = None
+
+    levels = [[] for _ in range(DEEPEST_LEVEL + 1)]
+    for level, grupo in bolhas.groupby("Level"):
+        levels[level] = grupo.drop(columns="Level").to_numpy().tolist()
+
+    return levels
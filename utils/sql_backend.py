@@ -0,0 +1,215 @@
+# Backend SQL opcional (DuckDB) para as tabelas agregadas dos gráficos, direto sobre o snapshot.
+#
+# Com FOME_ZERO_QUERY_BACKEND=duckdb, o cubo de agregados, as faixas de nota por cidade e o cubo
+# de culinárias por país são calculados por consultas SQL sobre o snapshot Parquet (e as partes
+# dos deltas ingeridos), em vez dos groupby do pandas sobre o dataframe em memória. O DuckDB lê
+# só as colunas usadas, executa em várias threads e pode agregar snapshots maiores que a memória
+# do processo. As tabelas têm as mesmas linhas, colunas, tipos e categorias das versões em pandas
+# (build_cube, build_rating_buckets e build_cuisine_cube), então os gráficos não mudam. As somas
+# de notas são feitas em outra ordem (FSUM, com compensação) e podem diferir no último bit.
+#
+# O DuckDB é uma dependência opcional (pip install duckdb): sem ele, ou sem a variável, os
+# gráficos usam o pandas.
+
+# Importando as Bibliotecas:
+
+import functools
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.data import DATASET_PATH, NEGATIVE_CUISINES, snapshot_files
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+QUERY_BACKEND_ENV_VAR = "FOME_ZERO_QUERY_BACKEND"
+QUERY_BACKENDS = ("pandas", "duckdb")
+
+logger = logging.getLogger(__name__)
+
+# Restaurantes da versão atual com deltas ingeridos: as linhas do snapshot do CSV cujo
+# Restaurant_ID não está em nenhuma parte e, de cada Restaurant_ID das partes, a linha da última
+# parte (os nomes NNNNNN.parquet seguem a ordem de ingestão), como em apply_deltas.
+RESTAURANTS_SQL = """
+CREATE VIEW restaurants AS
+SELECT * FROM snapshot
+WHERE Restaurant_ID NOT IN (SELECT Restaurant_ID FROM partes)
+UNION ALL BY NAME
+SELECT * EXCLUDE (filename) FROM partes
+QUALIFY ROW_NUMBER() OVER (PARTITION BY Restaurant_ID ORDER BY filename DESC) = 1
+"""
+
+# Cubo de agregados no grão (país, cidade, culinária), como build_cube.
+CUBE_SQL = """
+SELECT
+    Country_Name,
+    City,
+    Cuisines,
+    COUNT(*) AS Restaurants,
+    CAST(SUM(Votes) AS BIGINT) AS Votes_sum,
+    CAST(SUM(Average_Cost_for_two) AS BIGINT) AS Cost_for_two_sum
+FROM restaurants
+GROUP BY Country_Name, City, Cuisines
+ORDER BY Country_Name, City, Cuisines
+"""
+
+# Restaurantes por (país, cidade, faixa de nota), como build_rating_buckets. A faixa sai como
+# a posição em RATING_BUCKETS. Parâmetros: limites internos de RATING_BINS.
+RATING_BUCKETS_SQL = """
+SELECT
+    Country_Name,
+    City,
+    CASE WHEN Aggregate_rating < $1 THEN 0 WHEN Aggregate_rating < $2 THEN 1 ELSE 2 END
+        AS Rating_bucket,
+    COUNT(*) AS Restaurants
+FROM restaurants
+GROUP BY ALL
+ORDER BY Country_Name, City, Rating_bucket
+"""
+
+# Cubo de culinárias por país com todas as culinárias de cada restaurante, como
+# build_cuisine_cube. Só os textos distintos de All_Cuisines (as combinações) são separados, e
+# cada restaurante conta uma vez em cada culinária distinta da sua combinação (JOIN).
+# Parâmetros: MIN_VOTES e NEGATIVE_CUISINES.
+CUISINE_CUBE_SQL = """
+WITH combinacoes AS (
+    SELECT DISTINCT All_Cuisines, TRIM(UNNEST(STRING_SPLIT(All_Cuisines, ','))) AS Cuisines
+    FROM (SELECT DISTINCT All_Cuisines FROM restaurants)
+)
+SELECT
+    r.Country_Name,
+    c.Cuisines,
+    COUNT(*) AS Restaurants,
+    CAST(COUNT(*) FILTER (WHERE r.Votes >= $1) AS BIGINT) AS Restaurants_min_votes,
+    FSUM(CASE WHEN r.Votes >= $1 THEN r.Aggregate_rating ELSE 0.0 END) AS Rating_sum_min_votes
+FROM restaurants AS r
+JOIN combinacoes AS c ON r.All_Cuisines = c.All_Cuisines
+WHERE c.Cuisines <> '' AND NOT LIST_CONTAINS($2, c.Cuisines)
+GROUP BY r.Country_Name, c.Cuisines
+ORDER BY r.Country_Name, c.Cuisines
+"""
+
+
+# --------------------------------------------------------------------------------------------------
+#                                           Funções
+# --------------------------------------------------------------------------------------------------
+
+
+def query_backend():
+    """Esta função indica qual backend calcula as tabelas agregadas dos gráficos.
+
+    Input: Nenhum.
+    Output: "duckdb" com FOME_ZERO_QUERY_BACKEND=duckdb e o DuckDB instalado, "pandas" caso
+            contrário.
+    """
+    backend = os.environ.get(QUERY_BACKEND_ENV_VAR, "") or "pandas"
+    if backend not in QUERY_BACKENDS:
+        raise ValueError(f"{QUERY_BACKEND_ENV_VAR}={backend}: use um de {QUERY_BACKENDS}")
+
+    if backend == "duckdb" and duckdb is None:
+        _warn_missing_duckdb()
+        return "pandas"
+
+    return backend
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_missing_duckdb():
+    # Um único aviso por processo, e não um a cada execução das páginas.
+    logger.warning(
+        "%s=duckdb, mas o DuckDB não está instalado; usando o pandas", QUERY_BACKEND_ENV_VAR
+    )
+
+
+def connect(path=DATASET_PATH):
+    """Esta função abre uma conexão DuckDB com a view 'restaurants' sobre os arquivos Parquet.
+
+    Os arquivos são o snapshot do CSV e as partes dos deltas ingeridos (snapshot_files), que são
+    gravados antes quando não correspondem à versão atual dos dados. Com deltas, a view junta
+    os arquivos com a última versão de cada Restaurant_ID (RESTAURANTS_SQL).
+
+    Input: Caminho do arquivo de dados.
+    Output: Conexão DuckDB em memória.
+    """
+    parquet_path, *partes = snapshot_files(path)
+
+    con = duckdb.connect()
+    if not partes:
+        con.read_parquet(parquet_path).create_view("restaurants")
+        return con
+
+    con.read_parquet(parquet_path).create_view("snapshot")
+    con.read_parquet(partes, filename=True, union_by_name=True).create_view("partes")
+    con.execute(RESTAURANTS_SQL)
+
+    return con
+
+
+def categorize(con, tabela, cols):
+    """Esta função converte as colunas de texto do resultado de uma consulta para categóricas.
+
+    As categorias são os valores distintos da coluna no snapshot, em ordem alfabética, que são
+    as mesmas categorias do dataframe carregado por load_data.
+
+    Input: Conexão DuckDB, resultado da consulta e colunas a converter.
+    Output: Resultado com as colunas categóricas (ordered=True).
+    """
+    for col in cols:
+        categorias = con.execute(f"SELECT DISTINCT {col} FROM restaurants ORDER BY 1").fetchnumpy()
+        tabela[col] = pd.Categorical(tabela[col], categories=categorias[col], ordered=True)
+
+    return tabela
+
+
+# Função de Criação do Cubo de Agregados com SQL:
+def query_cube(path):
+    """Esta função cria o cubo de agregados (build_cube) com uma consulta SQL ao snapshot.
+
+    Input: Caminho do arquivo de dados.
+    Output: Cubo de agregados
+    """
+    with connect(path) as con:
+        cube = con.execute(CUBE_SQL).df()
+        return categorize(con, cube, ["Country_Name", "City", "Cuisines"])
+
+
+# Função de Criação das Faixas de Nota por Cidade com SQL:
+def query_rating_buckets(path, bins, labels):
+    """Esta função cria a tabela de faixas de nota (build_rating_buckets) com SQL.
+
+    Input: Caminho do arquivo de dados, limites (RATING_BINS) e nomes (RATING_BUCKETS) das faixas.
+    Output: Tabela com as colunas Country_Name, City, Rating_bucket e Restaurants
+    """
+    with connect(path) as con:
+        rating_buckets = con.execute(RATING_BUCKETS_SQL, [float(b) for b in bins[1:-1]]).df()
+        rating_buckets["Rating_bucket"] = pd.Categorical.from_codes(
+            rating_buckets["Rating_bucket"].to_numpy(np.int64), labels, ordered=True
+        )
+        return categorize(con, rating_buckets, ["Country_Name", "City"])
+
+
+# Função de Criação do Cubo de Culinárias por País com SQL:
+def query_cuisine_cube(path, min_votes):
+    """Esta função cria o cubo de culinárias por país (build_cuisine_cube) com SQL.
+
+    O texto de cada combinação de All_Cuisines é separado pela vírgula e cada nome recebe TRIM,
+    como em split_cuisines; os nomes vazios, repetidos na mesma combinação ou de
+    NEGATIVE_CUISINES ficam de fora.
+
+    Input: Caminho do arquivo de dados e mínimo de avaliações (MIN_VOTES).
+    Output: Tabela com as colunas Country_Name, Cuisines e os agregados.
+    """
+    with connect(path) as con:
+        cuisine_cube = con.execute(CUISINE_CUBE_SQL, [min_votes, NEGATIVE_CUISINES]).df()
+        cuisine_cube = categorize(con, cuisine_cube, ["Country_Name"])
+        cuisine_cube["Cuisines"] = pd.Categorical(
+            cuisine_cube["Cuisines"],
+            categories=np.unique(cuisine_cube["Cuisines"].to_numpy(str)),
+            ordered=True,
+        )
+        return cuisine_cube